@@ -1,760 +1,1015 @@
-import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
-import requests
-import re
-import json
-from datetime import datetime
-from urllib.parse import quote_plus
-import time
-
-# Set page config
-st.set_page_config(
-    page_title="RankBuddy - Real-time SEO Optimizer",
-    page_icon="📈",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-class RealTimeKeywordAPI:
-    """Real-time keyword data from free APIs only"""
-    
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
-    
-    def get_google_autocomplete(self, keyword):
-        """Get real Google autocomplete suggestions"""
-        suggestions = []
-        try:
-            # Google Suggest API
-            url = "http://suggestqueries.google.com/complete/search"
-            params = {
-                'client': 'firefox',
-                'q': keyword,
-                'hl': 'en'
-            }
-            
-            response = self.session.get(url, params=params, timeout=15)
-            if response.status_code == 200:
-                data = response.json()
-                if len(data) > 1 and data[1]:
-                    suggestions = [s for s in data[1] if s and s != keyword]
-            
-            return suggestions[:20]
-            
-        except Exception as e:
-            st.error(f"Google Autocomplete API error: {str(e)}")
-            return []
-    
-    def get_google_related_searches(self, keyword):
-        """Get related searches using different variations"""
-        related = []
-        try:
-            # Try different keyword variations for more suggestions
-            variations = [
-                f"how to {keyword}",
-                f"what is {keyword}",
-                f"best {keyword}",
-                f"{keyword} guide",
-                f"{keyword} tutorial",
-                f"{keyword} tips",
-                f"{keyword} examples",
-                f"{keyword} tools",
-                f"{keyword} free",
-                f"{keyword} 2024"
-            ]
-            
-            for variation in variations:
-                try:
-                    url = "http://suggestqueries.google.com/complete/search"
-                    params = {
-                        'client': 'firefox',
-                        'q': variation,
-                        'hl': 'en'
-                    }
-                    
-                    response = self.session.get(url, params=params, timeout=10)
-                    if response.status_code == 200:
-                        data = response.json()
-                        if len(data) > 1 and data[1]:
-                            related.extend([s for s in data[1] if s and keyword.lower() in s.lower()])
-                    
-                    time.sleep(0.1)  # Be respectful to the API
-                except:
-                    continue
-            
-            return list(set(related))[:30]
-            
-        except Exception as e:
-            st.error(f"Related searches API error: {str(e)}")
-            return []
-    
-    def get_datamuse_related(self, keyword):
-        """Get semantically related words from Datamuse API"""
-        related_words = []
-        try:
-            # Get words with similar meaning
-            url = "https://api.datamuse.com/words"
-            
-            # Similar meaning
-            params = {'ml': keyword, 'max': 20}
-            response = self.session.get(url, params=params, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                related_words.extend([item['word'] for item in data if 'word' in item])
-            
-            # Words that often follow
-            params = {'lc': keyword, 'max': 15}
-            response = self.session.get(url, params=params, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                related_words.extend([item['word'] for item in data if 'word' in item])
-            
-            # Words that often precede
-            params = {'rc': keyword, 'max': 15}
-            response = self.session.get(url, params=params, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                related_words.extend([item['word'] for item in data if 'word' in item])
-            
-            return list(set(related_words))[:25]
-            
-        except Exception as e:
-            st.error(f"Datamuse API error: {str(e)}")
-            return []
-    
-    def get_wikipedia_terms(self, keyword):
-        """Get related terms from Wikipedia"""
-        related_terms = []
-        try:
-            # Search Wikipedia
-            search_url = "https://en.wikipedia.org/api/rest_v1/page/summary/" + quote_plus(keyword)
-            response = self.session.get(search_url, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                extract = data.get('extract', '')
-                
-                # Extract meaningful terms from the text
-                words = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', extract)
-                # Filter out common words and get unique terms
-                common_words = {'The', 'This', 'That', 'These', 'Those', 'And', 'But', 'Or', 'If', 'When', 'Where', 'How', 'What', 'Why', 'Who', 'Which'}
-                related_terms = [word for word in set(words) if word not in common_words and len(word) > 3]
-            
-            # Also try Wikipedia search API
-            search_api_url = "https://en.wikipedia.org/w/api.php"
-            params = {
-                'action': 'query',
-                'format': 'json',
-                'list': 'search',
-                'srsearch': keyword,
-                'srlimit': 10
-            }
-            
-            response = self.session.get(search_api_url, params=params, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                if 'query' in data and 'search' in data['query']:
-                    titles = [item['title'] for item in data['query']['search']]
-                    related_terms.extend(titles)
-            
-            return list(set(related_terms))[:20]
-            
-        except Exception as e:
-            st.error(f"Wikipedia API error: {str(e)}")
-            return []
-    
-    def estimate_keyword_difficulty(self, keyword):
-        """Estimate difficulty based on search volume indicators"""
-        try:
-            # Simple heuristic based on keyword characteristics
-            words = keyword.lower().split()
-            word_count = len(words)
-            avg_length = sum(len(word) for word in words) / len(words) if words else 0
-            
-            # Longer, more specific keywords are generally easier
-            base_difficulty = max(10, 80 - (word_count * 15) - (avg_length * 2))
-            
-            # Adjust based on common high-competition terms
-            high_competition_terms = ['best', 'top', 'free', 'review', 'buy', 'cheap', 'price']
-            competition_boost = sum(5 for term in high_competition_terms if term in keyword.lower())
-            
-            difficulty = min(95, base_difficulty + competition_boost)
-            return difficulty
-            
-        except:
-            return 50  # Default medium difficulty
-
-class RealTimeSEOAnalyzer:
-    """SEO analysis using only real-time API data"""
-    
-    def __init__(self):
-        self.api = RealTimeKeywordAPI()
-    
-    def generate_real_keywords(self, seed_keyword):
-        """Generate keywords using only real API data"""
-        all_keywords = set()
-        all_keywords.add(seed_keyword.lower())
-        
-        # Get Google autocomplete suggestions
-        st.info("🔍 Fetching Google autocomplete suggestions...")
-        google_suggestions = self.api.get_google_autocomplete(seed_keyword)
-        all_keywords.update(google_suggestions)
-        
-        # Get Google related searches
-        st.info("🔍 Fetching Google related searches...")
-        google_related = self.api.get_google_related_searches(seed_keyword)
-        all_keywords.update(google_related)
-        
-        # Get Datamuse related words
-        st.info("🔍 Fetching semantic word relationships...")
-        datamuse_words = self.api.get_datamuse_related(seed_keyword)
-        # Create keyword combinations with Datamuse words
-        for word in datamuse_words:
-            all_keywords.add(f"{word} {seed_keyword}")
-            all_keywords.add(f"{seed_keyword} {word}")
-        
-        # Get Wikipedia related terms
-        st.info("🔍 Fetching Wikipedia related terms...")
-        wiki_terms = self.api.get_wikipedia_terms(seed_keyword)
-        for term in wiki_terms:
-            if len(term.split()) <= 3:  # Only short terms
-                all_keywords.add(f"{term.lower()} {seed_keyword}")
-                all_keywords.add(f"{seed_keyword} {term.lower()}")
-        
-        # Filter and clean keywords
-        filtered_keywords = []
-        for keyword in all_keywords:
-            if 3 <= len(keyword) <= 100 and len(keyword.split()) <= 6:
-                filtered_keywords.append(keyword.strip().lower())
-        
-        return list(set(filtered_keywords))[:50]  # Return top 50 unique keywords
-    
-    def categorize_keywords(self, keywords):
-        """Categorize keywords into short-tail and long-tail"""
-        short_tail = []
-        long_tail = []
-        
-        for keyword in keywords:
-            word_count = len(keyword.split())
-            if word_count <= 2:
-                short_tail.append(keyword)
-            else:
-                long_tail.append(keyword)
-        
-        return short_tail, long_tail
-    
-    def analyze_keyword_difficulty(self, keywords):
-        """Analyze difficulty for all keywords"""
-        difficulties = {}
-        for keyword in keywords:
-            difficulties[keyword] = self.api.estimate_keyword_difficulty(keyword)
-        return difficulties
-    
-    def suggest_content_structure(self, keyword, related_keywords):
-        """Suggest content structure based on real keyword data"""
-        structure = {
-            'titles': [
-                f"Complete Guide to {keyword.title()}",
-                f"How to Master {keyword.title()}: Expert Tips",
-                f"{keyword.title()}: Everything You Need to Know",
-                f"Ultimate {keyword.title()} Tutorial for Beginners",
-                f"Advanced {keyword.title()}: Best Practices"
-            ],
-            'headings': [
-                f"What is {keyword.title()}?",
-                f"Why {keyword.title()} Matters in 2024",
-                f"Getting Started with {keyword.title()}",
-                f"Advanced {keyword.title()} Strategies",
-                f"Common {keyword.title()} Mistakes to Avoid",
-                f"Best {keyword.title()} Tools and Resources",
-                f"Real-World {keyword.title()} Examples",
-                f"{keyword.title()} Future Trends"
-            ],
-            'meta_description': f"Master {keyword} with our comprehensive guide. Learn proven strategies, avoid common mistakes, and get expert tips for success.",
-            'target_length': 2000,
-            'keyword_density': 1.5
-        }
-        
-        return structure
-
-def main():
-    # Initialize analyzer
-    if 'analyzer' not in st.session_state:
-        st.session_state.analyzer = RealTimeSEOAnalyzer()
-    
-    analyzer = st.session_state.analyzer
-    
-    # Header
-    st.title("📈 RankBuddy - Real-Time SEO")
-    st.markdown("*Powered by real-time keyword data from Google, Datamuse & Wikipedia APIs*")
-    
-    # Sidebar
-    st.sidebar.header("🎯 Real-Time Keyword Research")
-    st.sidebar.success("✅ Using live API data only")
-    st.sidebar.markdown("**Data Sources:**")
-    st.sidebar.markdown("• Google Autocomplete API")
-    st.sidebar.markdown("• Google Related Searches")
-    st.sidebar.markdown("• Datamuse Semantic API")
-    st.sidebar.markdown("• Wikipedia Search API")
-    
-    # Main input
-    seed_keyword = st.sidebar.text_input(
-        "Enter your target keyword:",
-        placeholder="e.g., digital marketing",
-        help="Enter the keyword you want to rank for"
-    )
-    
-    if seed_keyword:
-        # Generate keywords with real-time progress
-        if 'current_keyword' not in st.session_state or st.session_state.current_keyword != seed_keyword:
-            st.session_state.current_keyword = seed_keyword
-            
-            with st.spinner('🌐 Fetching real-time keyword data...'):
-                # Generate keywords
-                st.session_state.all_keywords = analyzer.generate_real_keywords(seed_keyword)
-                
-                # Categorize keywords
-                short_tail, long_tail = analyzer.categorize_keywords(st.session_state.all_keywords)
-                st.session_state.short_tail = short_tail
-                st.session_state.long_tail = long_tail
-                
-                # Analyze difficulties
-                st.session_state.difficulties = analyzer.analyze_keyword_difficulty(st.session_state.all_keywords)
-                
-                # Generate content structure
-                st.session_state.structure = analyzer.suggest_content_structure(seed_keyword, st.session_state.all_keywords)
-        
-        # Tabs
-        tab1, tab2, tab3, tab4, tab5 = st.tabs([
-            "🔍 Keywords", "📊 Analysis", "📝 Content", "👀 SERP Preview", "📄 Export"
-        ])
-        
-        with tab1:
-            st.header("Real-Time Keyword Research")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.subheader("Short-Tail Keywords")
-                st.caption(f"Found {len(st.session_state.short_tail)} short-tail keywords")
-                
-                for keyword in st.session_state.short_tail[:15]:
-                    difficulty = st.session_state.difficulties.get(keyword, 50)
-                    color = "🟢" if difficulty < 30 else "🟡" if difficulty < 70 else "🔴"
-                    st.write(f"{color} **{keyword}** (Difficulty: {difficulty:.0f})")
-            
-            with col2:
-                st.subheader("Long-Tail Keywords")
-                st.caption(f"Found {len(st.session_state.long_tail)} long-tail keywords")
-                
-                for keyword in st.session_state.long_tail[:15]:
-                    difficulty = st.session_state.difficulties.get(keyword, 50)
-                    color = "🟢" if difficulty < 30 else "🟡" if difficulty < 70 else "🔴"
-                    st.write(f"{color} **{keyword}** (Difficulty: {difficulty:.0f})")
-        
-        with tab2:
-            st.header("Keyword Analysis")
-            
-            # Get difficulty values
-            all_difficulties = list(st.session_state.difficulties.values())
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                # Difficulty distribution chart
-                st.subheader("Difficulty Distribution")
-                fig, ax = plt.subplots(figsize=(10, 6))
-                ax.hist(all_difficulties, bins=15, color='skyblue', alpha=0.7, edgecolor='black')
-                ax.set_xlabel('Difficulty Score')
-                ax.set_ylabel('Number of Keywords')
-                ax.set_title('Real-Time Keyword Difficulty Analysis')
-                st.pyplot(fig)
-            
-            with col2:
-                st.subheader("Live Metrics")
-                
-                avg_difficulty = np.mean(all_difficulties)
-                st.metric("Average Difficulty", f"{avg_difficulty:.1f}")
-                
-                easy_count = sum(1 for d in all_difficulties if d < 30)
-                st.metric("Easy Keywords", easy_count)
-                
-                medium_count = sum(1 for d in all_difficulties if 30 <= d < 70)
-                st.metric("Medium Keywords", medium_count)
-                
-                hard_count = sum(1 for d in all_difficulties if d >= 70)
-                st.metric("Hard Keywords", hard_count)
-                
-                st.subheader("Recommendations")
-                if easy_count > 5:
-                    st.success("✅ Great! You have many easy keywords to target.")
-                elif medium_count > easy_count:
-                    st.warning("⚠️ Focus on medium difficulty keywords for quick wins.")
-                else:
-                    st.info("💡 Consider more specific long-tail variations.")
-        
-        with tab3:
-            st.header("Content Structure")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.subheader("Title Suggestions")
-                for i, title in enumerate(st.session_state.structure['titles']):
-                    st.write(f"**{i+1}.** {title}")
-                
-                st.subheader("Content Guidelines")
-                st.write(f"**Target Length:** {st.session_state.structure['target_length']:,} words")
-                st.write(f"**Keyword Density:** {st.session_state.structure['keyword_density']}%")
-                
-                keyword_mentions = int(st.session_state.structure['target_length'] * st.session_state.structure['keyword_density'] / 100)
-                st.write(f"**Target Mentions:** {keyword_mentions} times")
-            
-            with col2:
-                st.subheader("Suggested Headings")
-                for heading in st.session_state.structure['headings']:
-                    st.write(f"• {heading}")
-                
-                st.subheader("Meta Description")
-                st.info(st.session_state.structure['meta_description'])
-        
-        with tab4:
-            st.header("SERP Preview")
-            
-            selected_title = st.selectbox("Choose title:", st.session_state.structure['titles'])
-            custom_title = st.text_input("Or enter custom title:", value=selected_title)
-            
-            meta_desc = st.text_area("Meta description:", 
-                                   value=st.session_state.structure['meta_description'],
-                                   max_chars=160)
-            
-            url_slug = re.sub(r'[^a-z0-9]+', '-', seed_keyword.lower()).strip('-')
-            custom_url = st.text_input("URL:", value=f"https://yourblog.com/{url_slug}")
-            
-            # SERP Preview
-            title_display = custom_title[:60] + "..." if len(custom_title) > 60 else custom_title
-            meta_display = meta_desc[:160] + "..." if len(meta_desc) > 160 else meta_desc
-            
-            st.markdown(f"""
-            <div style="border: 1px solid #ddd; padding: 20px; border-radius: 8px; background: #f9f9f9;">
-                <h3 style="color: #1a0dab; margin: 0; font-size: 20px;">{title_display}</h3>
-                <p style="color: #006621; margin: 5px 0; font-size: 14px;">{custom_url}</p>
-                <p style="color: #545454; margin: 10px 0 0 0; font-size: 13px;">{meta_display}</p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Length indicators
-            col1, col2 = st.columns(2)
-            with col1:
-                title_status = "✅" if 50 <= len(custom_title) <= 60 else "⚠️"
-                st.write(f"{title_status} Title: {len(custom_title)} characters")
-            
-            with col2:
-                meta_status = "✅" if 150 <= len(meta_desc) <= 160 else "⚠️"
-                st.write(f"{meta_status} Meta: {len(meta_desc)} characters")
-        
-        with tab5:
-            st.header("Export Research")
-            
-            # Add tabs for different export options
-            export_tab1, export_tab2 = st.tabs(["📄 SEO Data", "🤖 AI Blog Prompt"])
-            
-            with export_tab1:
-                st.subheader("Export SEO Research Data")
-                export_format = st.selectbox("Format:", ["Markdown", "Text", "JSON"])
-                
-                if st.button("Generate SEO Export"):
-                    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                    
-                    if export_format == "Markdown":
-                        content = f"""# Real-Time SEO Research: {seed_keyword.title()}
-
-Generated: {timestamp}
-
-## Keywords Found
-- **Total Keywords:** {len(st.session_state.all_keywords)}
-- **Short-tail:** {len(st.session_state.short_tail)}
-- **Long-tail:** {len(st.session_state.long_tail)}
-
-### Top Short-Tail Keywords
-"""
-                        for kw in st.session_state.short_tail[:10]:
-                            diff = st.session_state.difficulties.get(kw, 50)
-                            content += f"- **{kw}** (Difficulty: {diff:.0f})\n"
-                        
-                        content += "\n### Top Long-Tail Keywords\n"
-                        for kw in st.session_state.long_tail[:15]:
-                            diff = st.session_state.difficulties.get(kw, 50)
-                            content += f"- **{kw}** (Difficulty: {diff:.0f})\n"
-                        
-                        content += f"""
-## Content Strategy
-### Recommended Title
-{st.session_state.structure['titles'][0]}
-
-### Meta Description
-{st.session_state.structure['meta_description']}
-
-### Content Structure
-"""
-                        for heading in st.session_state.structure['headings']:
-                            content += f"- {heading}\n"
-                        
-                        content += f"""
-## SEO Guidelines
-- Target Length: {st.session_state.structure['target_length']:,} words
-- Keyword Density: {st.session_state.structure['keyword_density']}%
-- Focus on easy-difficulty keywords first
-- Use long-tail keywords in subheadings
-
----
-*Generated by RankBuddy Real-Time SEO Analyzer*
-"""
-                    
-                    elif export_format == "JSON":
-                        content = json.dumps({
-                            'keyword': seed_keyword,
-                            'timestamp': timestamp,
-                            'short_tail_keywords': st.session_state.short_tail,
-                            'long_tail_keywords': st.session_state.long_tail,
-                            'difficulties': st.session_state.difficulties,
-                            'content_structure': st.session_state.structure
-                        }, indent=2)
-                    
-                    else:  # Text format
-                        content = f"""REAL-TIME SEO RESEARCH: {seed_keyword.upper()}
-Generated: {timestamp}
-
-KEYWORDS FOUND:
-Total: {len(st.session_state.all_keywords)}
-Short-tail: {len(st.session_state.short_tail)}
-Long-tail: {len(st.session_state.long_tail)}
-
-TOP KEYWORDS:
-"""
-                        for kw in st.session_state.all_keywords[:20]:
-                            diff = st.session_state.difficulties.get(kw, 50)
-                            content += f"- {kw} (Difficulty: {diff:.0f})\n"
-                    
-                    st.download_button(
-                        label=f"Download {export_format}",
-                        data=content,
-                        file_name=f"rankbuddy_realtime_{seed_keyword.replace(' ', '_')}.{export_format.lower()}",
-                        mime="text/plain"
-                    )
-                    
-                    st.code(content, language=export_format.lower())
-            
-            with export_tab2:
-                st.subheader("🤖 AI Blog Writing Prompt")
-                st.markdown("*Copy this prompt and paste it into ChatGPT, Claude, or any AI writing tool*")
-                
-                # Generate the AI prompt
-                def generate_ai_prompt():
-                    # Get best keywords (easy difficulty first)
-                    easy_keywords = [kw for kw, diff in st.session_state.difficulties.items() if diff < 30]
-                    medium_keywords = [kw for kw, diff in st.session_state.difficulties.items() if 30 <= diff < 50]
-                    
-                    # Select best secondary keywords
-                    secondary_keywords = (easy_keywords[:8] + medium_keywords[:5])[:12]
-                    secondary_keywords_str = ", ".join(secondary_keywords)
-                    
-                    # Calculate target word count and keyword mentions
-                    target_words = st.session_state.structure['target_length']
-                    keyword_density = st.session_state.structure['keyword_density']
-                    target_mentions = int(target_words * keyword_density / 100)
-                    
-                    prompt = f"""✍️ **BLOG POST WRITING PROMPT - OPTIMIZED FOR GOOGLE RANKING #1**
-
-🎯 **MISSION**: Write a comprehensive, SEO-optimized blog post that has the best chance of ranking #1 on Google for the target keyword. Follow this template exactly and adapt it to provide maximum value to readers.
-
-📊 **KEYWORD STRATEGY**:
-🧠 **Primary Keyword**: {seed_keyword}
-🔑 **Secondary Keywords** (use naturally throughout): {secondary_keywords_str}
-📈 **Target**: Use primary keyword {target_mentions} times in {target_words:,} words (≈{keyword_density}% density)
-
-🏗️ **REQUIRED STRUCTURE**:
-
-**1. TITLE (H1)**
-• Include "{seed_keyword}" at the beginning
-• Keep under 60 characters
-• Make it compelling and click-worthy
-• Suggested: "{st.session_state.structure['titles'][0]}"
-
-**2. META DESCRIPTION** (150-160 characters)
-• Summarize the post's value clearly
-• Include primary keyword once
-• Make it irresistible to click
-• Suggested: "{st.session_state.structure['meta_description']}"
-
-**3. INTRODUCTION** (150-200 words)
-• Start with a hook - common problem or surprising fact
-• Mention "{seed_keyword}" within first 100 words
-• Preview what readers will learn
-• Create urgency or curiosity
-
-**4. MAIN CONTENT** (Use these H2/H3 sections):
-"""
-                    
-                    # Add the suggested headings
-                    for i, heading in enumerate(st.session_state.structure['headings'], 1):
-                        prompt += f"\n**H{2 if i <= 4 else 3}. {heading}**"
-                        if i == 1:
-                            prompt += "\n• Define the topic clearly\n• Include keyword naturally\n• Provide context and importance"
-                        elif i == 2:
-                            prompt += "\n• Explain benefits and relevance\n• Use statistics or examples\n• Address reader's pain points"
-                        elif i <= 4:
-                            prompt += "\n• Provide actionable advice\n• Include specific examples\n• Use bullet points or numbered lists"
-                        else:
-                            prompt += "\n• Dive deeper into specific aspects\n• Share expert insights\n• Include real-world applications"
-                    
-                    prompt += f"""
-
-**5. CONCLUSION** (100-150 words)
-• Summarize key takeaways
-• Include strong call-to-action
-• Mention "{seed_keyword}" once more naturally
-• Encourage engagement (comments, shares, etc.)
-
-📝 **WRITING GUIDELINES**:
-• **Length**: Aim for {target_words:,} words total
-• **Tone**: Expert but accessible, helpful and actionable
-• **Keyword Usage**: Use "{seed_keyword}" {target_mentions} times naturally (not forced)
-• **Secondary Keywords**: Weave in secondary keywords naturally throughout
-• **Paragraphs**: Keep to 2-3 sentences max for readability
-• **Lists**: Use bullet points and numbered lists frequently
-• **Examples**: Include specific, real-world examples and case studies
-• **Links**: Mention where internal links and external authority links should go
-• **Images**: Suggest where images would enhance the content (every 300-400 words)
-• **Alt Text**: Provide keyword-rich alt text suggestions for images
-
-🎯 **SEO OPTIMIZATION CHECKLIST**:
-✅ Primary keyword in title, first paragraph, and conclusion
-✅ Secondary keywords distributed naturally throughout
-✅ Headers (H2, H3) include relevant keywords
-✅ Content answers search intent completely
-✅ Include FAQ section if applicable
-✅ Add schema markup suggestions
-✅ Optimize for featured snippets with clear answers
-✅ Include related topic coverage for topical authority
-
-🚀 **RANKING FACTORS TO EMPHASIZE**:
-• **E-A-T**: Showcase expertise, authority, and trustworthiness
-• **User Intent**: Fully satisfy what searchers are looking for
-• **Comprehensive Coverage**: Cover the topic thoroughly
-• **Unique Value**: Provide insights not found elsewhere
-• **Readability**: Easy to scan and consume
-• **Engagement**: Encourage comments and social sharing
-
-💡 **CONTENT ENHANCEMENT IDEAS**:
-• Include original research or data if possible
-• Add expert quotes or interviews
-• Create downloadable resources (checklists, templates)
-• Include comparison tables or charts
-• Add FAQ section with long-tail keyword questions
-• Provide step-by-step tutorials with screenshots
-• Include success stories or case studies
-• Address common objections or concerns
-
-📱 **MOBILE & USER EXPERIENCE**:
-• Write for mobile-first reading
-• Use short sentences and paragraphs
-• Include clear subheadings for easy scanning
-• Add table of contents for long posts
-• Ensure fast loading with optimized images
-
-🔍 **SEARCH INTENT OPTIMIZATION**:
-Based on the keyword "{seed_keyword}", this post should:
-• Provide comprehensive information (informational intent)
-• Include actionable steps (transactional intent)
-• Compare options if relevant (commercial intent)
-• Answer specific questions (navigational intent)
-
-**START WRITING NOW** - Create a blog post that will dominate search results and provide incredible value to readers. Remember: Google rewards content that best serves user intent with comprehensive, authoritative, and engaging information.
-
-**FINAL NOTE**: After writing, review to ensure the content flows naturally while hitting all SEO targets. The goal is to create content so valuable that other sites will want to link to it, readers will share it, and Google will rank it #1."""
-                    
-                    return prompt
-                
-                # Generate and display the prompt
-                ai_prompt = generate_ai_prompt()
-                
-                # Show the prompt in a text area for easy copying
-                st.text_area(
-                    "Complete AI Writing Prompt:",
-                    value=ai_prompt,
-                    height=400,
-                    help="Copy this entire prompt and paste it into ChatGPT, Claude, or your preferred AI writing tool"
-                )
-                
-                # Download button for the prompt
-                st.download_button(
-                    label="📄 Download AI Prompt",
-                    data=ai_prompt,
-                    file_name=f"ai_blog_prompt_{seed_keyword.replace(' ', '_')}.txt",
-                    mime="text/plain"
-                )
-                
-                # Quick copy instructions
-                st.info("💡 **How to use:** Copy the prompt above, paste it into ChatGPT or any AI writing tool, and get a perfectly optimized blog post!")
-                
-                # Additional customization options
-                with st.expander("🎨 Customize AI Prompt"):
-                    custom_target_words = st.number_input("Target word count:", min_value=500, max_value=5000, value=st.session_state.structure['target_length'], step=100)
-                    custom_tone = st.selectbox("Writing tone:", ["Expert but accessible", "Casual and friendly", "Professional and formal", "Conversational", "Technical and detailed"])
-                    custom_audience = st.text_input("Target audience:", placeholder="e.g., small business owners, beginners, professionals")
-                    include_faq = st.checkbox("Include FAQ section", value=True)
-                    include_examples = st.checkbox("Emphasize real-world examples", value=True)
-                    
-                    if st.button("Generate Custom Prompt"):
-                        # Regenerate with custom options
-                        custom_prompt = ai_prompt.replace(f"{st.session_state.structure['target_length']:,} words", f"{custom_target_words:,} words")
-                        custom_prompt = custom_prompt.replace("Expert but accessible", custom_tone.lower())
-                        
-                        if custom_audience:
-                            custom_prompt = custom_prompt.replace("readers", f"{custom_audience}")
-                        
-                        if include_faq:
-                            custom_prompt += "\n\n**BONUS: FAQ SECTION**\nAdd a frequently asked questions section at the end with 5-8 questions that include long-tail keywords and provide concise, valuable answers."
-                        
-                        if include_examples:
-                            custom_prompt += "\n\n**EMPHASIS: REAL EXAMPLES**\nMake sure to include at least 3-5 specific, real-world examples throughout the post to demonstrate practical application."
-                        
-                        st.text_area(
-                            "Customized AI Prompt:",
-                            value=custom_prompt,
-                            height=300
-                        )
-                        
-                        st.download_button(
-                            label="📄 Download Custom Prompt",
-                            data=custom_prompt,
-                            file_name=f"custom_ai_prompt_{seed_keyword.replace(' ', '_')}.txt",
-                            mime="text/plain"
-                        )
-
-    else:
-        st.info("👆 Enter a keyword in the sidebar to start real-time analysis")
-        
-        # Show API status
-        st.subheader("🌐 API Status")
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.success("✅ Google Autocomplete")
-            st.caption("Real search suggestions")
-        
-        with col2:
-            st.success("✅ Datamuse API") 
-            st.caption("Semantic relationships")
-        
-        with col3:
-            st.success("✅ Wikipedia API")
-            st.caption("Related concepts")
-
-if __name__ == "__main__":
-    main()
+import streamlit as st
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import re
+import orjson
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from functools import lru_cache
+from itertools import islice
+
+# Set page config
+st.set_page_config(
+    page_title="RankBuddy - Real-time SEO Optimizer",
+    page_icon="📈",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+log = logging.getLogger('rankbuddy')
+
+# Compiled once - Streamlit reruns the whole script on every interaction
+_TITLECASE_RE = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
+_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+# Title-case words too generic to count as related terms
+_WIKI_COMMON_WORDS = frozenset({'The', 'This', 'That', 'These', 'Those', 'And', 'But', 'Or', 'If', 'When', 'Where', 'How', 'What', 'Why', 'Who', 'Which'})
+
+# Terms that signal high-competition commercial queries
+_HIGH_COMPETITION_TERMS = frozenset({'best', 'top', 'free', 'review', 'buy', 'cheap', 'price'})
+
+# Per-tier guidance bullets for the AI prompt's heading sections,
+# indexed by heading tier (intro, why-it-matters, how-to, deep-dive)
+_TIER_BULLETS = (
+    "\n• Define the topic clearly\n• Include keyword naturally\n• Provide context and importance",
+    "\n• Explain benefits and relevance\n• Use statistics or examples\n• Address reader's pain points",
+    "\n• Provide actionable advice\n• Include specific examples\n• Use bullet points or numbered lists",
+    "\n• Dive deeper into specific aspects\n• Share expert insights\n• Include real-world applications"
+)
+
+# The AI blog prompt is >95% static boilerplate - keep it as one
+# module-level template and fill in only the dynamic fields per run
+AI_PROMPT_TEMPLATE = """✍️ **BLOG POST WRITING PROMPT - OPTIMIZED FOR GOOGLE RANKING #1**
+
+🎯 **MISSION**: Write a comprehensive, SEO-optimized blog post that has the best chance of ranking #1 on Google for the target keyword. Follow this template exactly and adapt it to provide maximum value to readers.
+
+📊 **KEYWORD STRATEGY**:
+🧠 **Primary Keyword**: {seed_keyword}
+🔑 **Secondary Keywords** (use naturally throughout): {secondary_keywords}
+📈 **Target**: Use primary keyword {target_mentions} times in {target_words:,} words (≈{keyword_density}% density)
+
+🏗️ **REQUIRED STRUCTURE**:
+
+**1. TITLE (H1)**
+• Include "{seed_keyword}" at the beginning
+• Keep under 60 characters
+• Make it compelling and click-worthy
+• Suggested: "{suggested_title}"
+
+**2. META DESCRIPTION** (150-160 characters)
+• Summarize the post's value clearly
+• Include primary keyword once
+• Make it irresistible to click
+• Suggested: "{meta_description}"
+
+**3. INTRODUCTION** (150-200 words)
+• Start with a hook - common problem or surprising fact
+• Mention "{seed_keyword}" within first 100 words
+• Preview what readers will learn
+• Create urgency or curiosity
+
+**4. MAIN CONTENT** (Use these H2/H3 sections):
+{heading_sections}
+
+**5. CONCLUSION** (100-150 words)
+• Summarize key takeaways
+• Include strong call-to-action
+• Mention "{seed_keyword}" once more naturally
+• Encourage engagement (comments, shares, etc.)
+
+📝 **WRITING GUIDELINES**:
+• **Length**: Aim for {target_words:,} words total
+• **Tone**: Expert but accessible, helpful and actionable
+• **Keyword Usage**: Use "{seed_keyword}" {target_mentions} times naturally (not forced)
+• **Secondary Keywords**: Weave in secondary keywords naturally throughout
+• **Paragraphs**: Keep to 2-3 sentences max for readability
+• **Lists**: Use bullet points and numbered lists frequently
+• **Examples**: Include specific, real-world examples and case studies
+• **Links**: Mention where internal links and external authority links should go
+• **Images**: Suggest where images would enhance the content (every 300-400 words)
+• **Alt Text**: Provide keyword-rich alt text suggestions for images
+
+🎯 **SEO OPTIMIZATION CHECKLIST**:
+✅ Primary keyword in title, first paragraph, and conclusion
+✅ Secondary keywords distributed naturally throughout
+✅ Headers (H2, H3) include relevant keywords
+✅ Content answers search intent completely
+✅ Include FAQ section if applicable
+✅ Add schema markup suggestions
+✅ Optimize for featured snippets with clear answers
+✅ Include related topic coverage for topical authority
+
+🚀 **RANKING FACTORS TO EMPHASIZE**:
+• **E-A-T**: Showcase expertise, authority, and trustworthiness
+• **User Intent**: Fully satisfy what searchers are looking for
+• **Comprehensive Coverage**: Cover the topic thoroughly
+• **Unique Value**: Provide insights not found elsewhere
+• **Readability**: Easy to scan and consume
+• **Engagement**: Encourage comments and social sharing
+
+💡 **CONTENT ENHANCEMENT IDEAS**:
+• Include original research or data if possible
+• Add expert quotes or interviews
+• Create downloadable resources (checklists, templates)
+• Include comparison tables or charts
+• Add FAQ section with long-tail keyword questions
+• Provide step-by-step tutorials with screenshots
+• Include success stories or case studies
+• Address common objections or concerns
+
+📱 **MOBILE & USER EXPERIENCE**:
+• Write for mobile-first reading
+• Use short sentences and paragraphs
+• Include clear subheadings for easy scanning
+• Add table of contents for long posts
+• Ensure fast loading with optimized images
+
+🔍 **SEARCH INTENT OPTIMIZATION**:
+Based on the keyword "{seed_keyword}", this post should:
+• Provide comprehensive information (informational intent)
+• Include actionable steps (transactional intent)
+• Compare options if relevant (commercial intent)
+• Answer specific questions (navigational intent)
+
+**START WRITING NOW** - Create a blog post that will dominate search results and provide incredible value to readers. Remember: Google rewards content that best serves user intent with comprehensive, authoritative, and engaging information.
+
+**FINAL NOTE**: After writing, review to ensure the content flows naturally while hitting all SEO targets. The goal is to create content so valuable that other sites will want to link to it, readers will share it, and Google will rank it #1."""
+
+
+@lru_cache(maxsize=4096)
+def _difficulty(keyword):
+    """Estimate difficulty for a single keyword (pure, memoized)"""
+    kw_lower = keyword.lower()
+    word_count = len(kw_lower.split())
+    # Sum of word lengths is the string length minus the separating spaces,
+    # so the average needs no per-word iteration at all
+    avg_length = (len(kw_lower) - (word_count - 1)) / word_count if word_count else 0
+
+    # Longer, more specific keywords are generally easier
+    base_difficulty = max(10, 80 - (word_count * 15) - (avg_length * 2))
+
+    # Adjust based on common high-competition terms
+    competition_boost = sum(1 for term in _HIGH_COMPETITION_TERMS if term in kw_lower) * 5
+
+    return min(95, base_difficulty + competition_boost)
+
+
+@st.cache_resource
+def get_http_session():
+    """Process-wide pooled HTTP session shared by every analyzer instance"""
+    session = requests.Session()
+    session.headers.update({
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+    })
+    # Size the connection pool for the parallel fan-out so connections
+    # get reused instead of re-handshaking, and retry transient errors
+    adapter = HTTPAdapter(
+        pool_connections=20,
+        pool_maxsize=40,
+        max_retries=Retry(total=2, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504])
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+@st.cache_resource
+def get_http2_client():
+    """Shared httpx client - multiplexes same-host requests over HTTP/2"""
+    import httpx
+
+    return httpx.Client(
+        http2=True,
+        headers={
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        },
+        timeout=10.0,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=10)
+    )
+
+
+class RealTimeKeywordAPI:
+    """Real-time keyword data from free APIs only"""
+    
+    def __init__(self):
+        self.session = get_http_session()
+        # Wikipedia and Datamuse speak HTTP/2 - their parallel requests
+        # multiplex over one connection instead of opening several
+        self.http2 = get_http2_client()
+        # ETag revalidation caches - a 304 skips the body download and
+        # JSON parse for Wikipedia/Datamuse lookups that repeat after the
+        # data cache's TTL expires
+        self._etags = {}
+        self._body_cache = {}
+        # The fetchers run on executor threads, where Streamlit elements
+        # are silently dropped - record failed sources here and let the
+        # pipeline report them once from the script thread
+        self.errors = []
+
+    def _conditional_get(self, url, params=None, timeout=10):
+        """GET with If-None-Match; a 304 returns the cached parsed body"""
+        cache_key = (url, tuple(sorted(params.items())) if params else None)
+        headers = {}
+        etag = self._etags.get(cache_key)
+        if etag:
+            headers['If-None-Match'] = etag
+
+        response = self.http2.get(url, params=params, timeout=timeout, headers=headers)
+
+        if response.status_code == 304 and cache_key in self._body_cache:
+            return self._body_cache[cache_key]
+
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
+            etag = response.headers.get('ETag')
+            if etag:
+                self._etags[cache_key] = etag
+                self._body_cache[cache_key] = data
+            return data
+
+        return None
+    
+    @st.cache_data(ttl=3600, max_entries=512, show_spinner=False, persist="disk")
+    def get_google_autocomplete(_self, keyword):
+        """Get real Google autocomplete suggestions"""
+        suggestions = []
+        try:
+            # Google Suggest API
+            url = "http://suggestqueries.google.com/complete/search"
+            params = {
+                'client': 'firefox',
+                'q': keyword,
+                'hl': 'en'
+            }
+            
+            response = _self.session.get(url, params=params, timeout=15)
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                if len(data) > 1 and data[1]:
+                    suggestions = [s for s in data[1] if s and s != keyword]
+            
+            return suggestions[:20]
+            
+        except Exception:
+            log.warning("Google autocomplete fetch failed", exc_info=True)
+            _self.errors.append('Google Autocomplete')
+            return []
+    
+    async def _fetch_suggest(self, session, variation, semaphore):
+        """Fetch suggestions for one keyword variation (async)"""
+        import aiohttp
+
+        try:
+            # Cap in-flight requests so we stay polite to the API
+            async with semaphore:
+                url = "http://suggestqueries.google.com/complete/search"
+                params = {
+                    'client': 'firefox',
+                    'q': variation,
+                    'hl': 'en'
+                }
+
+                async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                    if response.status == 200:
+                        data = orjson.loads(await response.read())
+                        if len(data) > 1 and data[1]:
+                            return [s for s in data[1] if s]
+            return []
+        except:
+            return []
+
+    async def _related_async(self, keyword):
+        """Fire all variation requests concurrently and merge results"""
+        # Deferred import - only loaded when a fan-out actually runs
+        import aiohttp
+
+        # Try different keyword variations for more suggestions
+        variations = [
+            f"how to {keyword}",
+            f"what is {keyword}",
+            f"best {keyword}",
+            f"{keyword} guide",
+            f"{keyword} tutorial",
+            f"{keyword} tips",
+            f"{keyword} examples",
+            f"{keyword} tools",
+            f"{keyword} free",
+            f"{keyword} 2024"
+        ]
+
+        semaphore = asyncio.Semaphore(5)
+        connector = aiohttp.TCPConnector(limit=10)
+        headers = dict(self.session.headers)
+
+        related = set()
+        kw_lower = keyword.casefold()
+        async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+            tasks = [asyncio.ensure_future(self._fetch_suggest(session, variation, semaphore))
+                     for variation in variations]
+            try:
+                for future in asyncio.as_completed(tasks):
+                    result = await future
+                    related.update(s for s in result if kw_lower in s.casefold())
+                    # The output is sliced to 30 anyway - stop fetching as
+                    # soon as the early variations have saturated it
+                    if len(related) >= 30:
+                        break
+            finally:
+                for task in tasks:
+                    task.cancel()
+
+        return list(islice(related, 30))
+
+    @st.cache_data(ttl=3600, max_entries=512, show_spinner=False, persist="disk")
+    def get_google_related_searches(_self, keyword):
+        """Get related searches using different variations"""
+        try:
+            return asyncio.run(_self._related_async(keyword))
+
+        except Exception:
+            log.warning("Google related searches fetch failed", exc_info=True)
+            _self.errors.append('Google Related Searches')
+            return []
+    
+    def _datamuse_fetch(self, params):
+        """Fetch one Datamuse query and return (word, score) pairs"""
+        data = self._conditional_get("https://api.datamuse.com/words", params=params)
+        if data:
+            return [(item['word'], item.get('score', 0)) for item in data if 'word' in item]
+        return []
+
+    @st.cache_data(ttl=3600, max_entries=512, show_spinner=False, persist="disk")
+    def get_datamuse_related(_self, keyword):
+        """Get semantically related words from Datamuse API, best-scored first"""
+        try:
+            # Similar meaning, words that often follow, words that often
+            # precede - three independent queries, fired in parallel over
+            # the shared session's keep-alive connection
+            queries = [
+                {'ml': keyword, 'max': 20},
+                {'lc': keyword, 'max': 15},
+                {'rc': keyword, 'max': 15}
+            ]
+
+            # Merge by keeping the best relevance score per word, then rank
+            # on that score so the 25 we keep are the strongest candidates
+            # rather than an arbitrary slice of an unordered set
+            scored = {}
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                for pairs in executor.map(_self._datamuse_fetch, queries):
+                    for word, score in pairs:
+                        if score > scored.get(word, -1):
+                            scored[word] = score
+
+            ranked = sorted(scored, key=scored.get, reverse=True)
+            return ranked[:25]
+
+        except Exception:
+            log.warning("Datamuse fetch failed", exc_info=True)
+            _self.errors.append('Datamuse')
+            return []
+
+    def _wiki_summary(self, keyword):
+        """Fetch the plain-text intro extract for a Wikipedia page
+
+        Uses prop=extracts with exintro/explaintext, which returns just the
+        intro paragraph instead of the REST summary's full payload
+        (thumbnails, coordinates, HTML variants we never read).
+        """
+        params = {
+            'action': 'query',
+            'format': 'json',
+            'prop': 'extracts',
+            'exintro': 1,
+            'explaintext': 1,
+            'redirects': 1,
+            'titles': keyword
+        }
+        data = self._conditional_get("https://en.wikipedia.org/w/api.php", params=params)
+        if data:
+            pages = data.get('query', {}).get('pages', {})
+            for page in pages.values():
+                return page.get('extract', '')
+        return ''
+
+    def _wiki_search(self, keyword):
+        """Fetch matching article titles from the Wikipedia search API"""
+        search_api_url = "https://en.wikipedia.org/w/api.php"
+        params = {
+            'action': 'query',
+            'format': 'json',
+            'list': 'search',
+            'srsearch': keyword,
+            'srlimit': 10,
+            # Titles are all we use - drop the HTML snippets and metadata
+            # the search endpoint sends by default
+            'srprop': ''
+        }
+        data = self._conditional_get(search_api_url, params=params)
+        if data and 'query' in data and 'search' in data['query']:
+            return [item['title'] for item in data['query']['search']]
+        return []
+
+    @st.cache_data(ttl=3600, max_entries=512, show_spinner=False, persist="disk")
+    def get_wikipedia_terms(_self, keyword):
+        """Get related terms from Wikipedia"""
+        related_terms = set()
+        try:
+            # Summary extract and title search are independent calls to the
+            # same host - run both at once over the pooled connection
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                summary_future = executor.submit(_self._wiki_summary, keyword)
+                search_future = executor.submit(_self._wiki_search, keyword)
+                extract = summary_future.result()
+                titles = search_future.result()
+
+            if extract:
+                # Extract meaningful terms from the text
+                words = _TITLECASE_RE.findall(extract)
+                # Filter out common words and get unique terms
+                related_terms = {word for word in words if word not in _WIKI_COMMON_WORDS and len(word) > 3}
+
+            related_terms.update(titles)
+
+            return list(islice(related_terms, 20))
+
+        except Exception:
+            log.warning("Wikipedia fetch failed", exc_info=True)
+            _self.errors.append('Wikipedia')
+            return []
+    
+    def estimate_keyword_difficulty(self, keyword):
+        """Estimate difficulty based on search volume indicators"""
+        try:
+            return _difficulty(keyword)
+
+        except:
+            return 50  # Default medium difficulty
+
+class RealTimeSEOAnalyzer:
+    """SEO analysis using only real-time API data"""
+    
+    def __init__(self):
+        self.api = RealTimeKeywordAPI()
+    
+    def generate_real_keywords(self, seed_keyword):
+        """Generate keywords using only real API data"""
+        # Normalize the seed once - every combination below reuses it
+        seed = seed_keyword.strip().casefold()
+        all_keywords = set()
+        all_keywords.add(seed)
+        self.api.errors.clear()
+        
+        # Fetch all four sources in parallel - they are independent network
+        # calls, and requests.Session is thread-safe for simple GETs
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            autocomplete_future = executor.submit(self.api.get_google_autocomplete, seed_keyword)
+            related_future = executor.submit(self.api.get_google_related_searches, seed_keyword)
+            datamuse_future = executor.submit(self.api.get_datamuse_related, seed_keyword)
+            wiki_future = executor.submit(self.api.get_wikipedia_terms, seed_keyword)
+
+            labels = {
+                autocomplete_future: "Google autocomplete suggestions",
+                related_future: "Google related searches",
+                datamuse_future: "semantic word relationships",
+                wiki_future: "Wikipedia related terms"
+            }
+            # Stream progress into a single placeholder that updates in
+            # place as each source finishes - the user sees movement as
+            # soon as the fastest API returns, and we don't leave a stack
+            # of four info boxes behind
+            progress_slot = st.empty()
+            for done, future in enumerate(as_completed(labels), 1):
+                progress_slot.info(f"🔍 Fetched {labels[future]} ({done}/{len(labels)})")
+            progress_slot.empty()
+
+            google_suggestions = autocomplete_future.result()
+            google_related = related_future.result()
+            datamuse_words = datamuse_future.result()
+            wiki_terms = wiki_future.result()
+
+        # Report failures here, on the script thread - the fetchers only
+        # log, since elements rendered from worker threads are dropped
+        if self.api.errors:
+            st.warning(f"{len(self.api.errors)} data source(s) unavailable: {', '.join(self.api.errors)}")
+
+        all_keywords.update(google_suggestions)
+        all_keywords.update(google_related)
+
+        # Create keyword combinations with Datamuse words
+        for word in datamuse_words:
+            all_keywords.add(f"{word} {seed}")
+            all_keywords.add(f"{seed} {word}")
+
+        for term in wiki_terms:
+            if len(term.split()) <= 3:  # Only short terms
+                term_norm = term.casefold()
+                all_keywords.add(f"{term_norm} {seed}")
+                all_keywords.add(f"{seed} {term_norm}")
+        
+        # Filter and clean keywords, keeping the word count computed here
+        # so categorization doesn't have to re-split every string
+        filtered_keywords = {}
+        for keyword in all_keywords:
+            keyword = keyword.strip().casefold()
+            word_count = len(keyword.split())
+            if 3 <= len(keyword) <= 100 and word_count <= 6:
+                filtered_keywords.setdefault(keyword, word_count)
+
+        return list(islice(filtered_keywords.items(), 50))  # Return top 50 unique keywords
+    
+    def categorize_keywords(self, keyword_counts):
+        """Categorize (keyword, word_count) pairs into short-tail and long-tail"""
+        short_tail = []
+        long_tail = []
+
+        for keyword, word_count in keyword_counts:
+            if word_count <= 2:
+                short_tail.append(keyword)
+            else:
+                long_tail.append(keyword)
+
+        return short_tail, long_tail
+    
+    def analyze_keyword_difficulty(self, keywords):
+        """Analyze difficulty for all keywords"""
+        return {keyword: self.api.estimate_keyword_difficulty(keyword) for keyword in keywords}
+    
+    @st.cache_data(ttl=86400, show_spinner=False, persist="disk")
+    def suggest_content_structure(_self, keyword, related_keywords):
+        """Suggest content structure based on real keyword data
+
+        Deterministic for a given keyword, so the result is disk-persisted
+        like the API fetches - a restart rebuilds the page from cache
+        instead of regenerating everything.
+        """
+        structure = {
+            'titles': [
+                f"Complete Guide to {keyword.title()}",
+                f"How to Master {keyword.title()}: Expert Tips",
+                f"{keyword.title()}: Everything You Need to Know",
+                f"Ultimate {keyword.title()} Tutorial for Beginners",
+                f"Advanced {keyword.title()}: Best Practices"
+            ],
+            'headings': [
+                f"What is {keyword.title()}?",
+                f"Why {keyword.title()} Matters in 2024",
+                f"Getting Started with {keyword.title()}",
+                f"Advanced {keyword.title()} Strategies",
+                f"Common {keyword.title()} Mistakes to Avoid",
+                f"Best {keyword.title()} Tools and Resources",
+                f"Real-World {keyword.title()} Examples",
+                f"{keyword.title()} Future Trends"
+            ],
+            'meta_description': f"Master {keyword} with our comprehensive guide. Learn proven strategies, avoid common mistakes, and get expert tips for success.",
+            'target_length': 2000,
+            'keyword_density': 1.5
+        }
+        
+        return structure
+
+@lru_cache(maxsize=128)
+def _apply_prompt_customizations(base_prompt, target_length, target_words, tone, audience, include_faq, include_examples):
+    """Apply the customization options to the base prompt (pure, memoized)
+
+    Users tend to toggle the same option combinations back and forth;
+    the cache returns the finished string without re-scanning the
+    multi-KB prompt.
+    """
+    # One alternation pattern, one scan - instead of a separate
+    # str.replace pass over the whole prompt per substitution
+    replacements = {
+        f"{target_length:,} words": f"{target_words:,} words",
+        "Expert but accessible": tone.lower()
+    }
+    if audience:
+        replacements["readers"] = audience
+
+    pattern = re.compile("|".join(re.escape(old) for old in replacements))
+    custom_prompt = pattern.sub(lambda m: replacements[m.group(0)], base_prompt)
+
+    if include_faq:
+        custom_prompt += "\n\n**BONUS: FAQ SECTION**\nAdd a frequently asked questions section at the end with 5-8 questions that include long-tail keywords and provide concise, valuable answers."
+
+    if include_examples:
+        custom_prompt += "\n\n**EMPHASIS: REAL EXAMPLES**\nMake sure to include at least 3-5 specific, real-world examples throughout the post to demonstrate practical application."
+
+    return custom_prompt
+
+@st.fragment
+def customize_prompt(ai_prompt, target_length, seed_keyword):
+    """Prompt customization expander - a fragment, so tweaking the inputs
+    reruns only this block instead of the whole page"""
+    with st.expander("🎨 Customize AI Prompt"):
+        custom_target_words = st.number_input("Target word count:", min_value=500, max_value=5000, value=target_length, step=100)
+        custom_tone = st.selectbox("Writing tone:", ["Expert but accessible", "Casual and friendly", "Professional and formal", "Conversational", "Technical and detailed"])
+        custom_audience = st.text_input("Target audience:", placeholder="e.g., small business owners, beginners, professionals")
+        include_faq = st.checkbox("Include FAQ section", value=True)
+        include_examples = st.checkbox("Emphasize real-world examples", value=True)
+
+        if st.button("Generate Custom Prompt"):
+            # Regenerate with custom options
+            custom_prompt = _apply_prompt_customizations(
+                ai_prompt, target_length, custom_target_words,
+                custom_tone, custom_audience, include_faq, include_examples
+            )
+
+            st.text_area(
+                "Customized AI Prompt:",
+                value=custom_prompt,
+                height=300
+            )
+
+            st.download_button(
+                label="📄 Download Custom Prompt",
+                data=custom_prompt,
+                file_name=f"custom_ai_prompt_{seed_keyword.replace(' ', '_')}.txt",
+                mime="text/plain"
+            )
+
+@st.fragment
+def serp_preview(structure, seed_keyword):
+    """SERP preview block - runs as a fragment so typing in its inputs
+    reruns only this block, not the whole script"""
+    st.header("SERP Preview")
+
+    selected_title = st.selectbox("Choose title:", structure['titles'])
+    custom_title = st.text_input("Or enter custom title:", value=selected_title)
+
+    meta_desc = st.text_area("Meta description:",
+                           value=structure['meta_description'],
+                           max_chars=160)
+
+    url_slug = _SLUG_RE.sub('-', seed_keyword.lower()).strip('-')
+    custom_url = st.text_input("URL:", value=f"https://yourblog.com/{url_slug}")
+
+    # SERP Preview
+    title_display = custom_title[:60] + "..." if len(custom_title) > 60 else custom_title
+    meta_display = meta_desc[:160] + "..." if len(meta_desc) > 160 else meta_desc
+
+    st.markdown(f"""
+    <div style="border: 1px solid #ddd; padding: 20px; border-radius: 8px; background: #f9f9f9;">
+        <h3 style="color: #1a0dab; margin: 0; font-size: 20px;">{title_display}</h3>
+        <p style="color: #006621; margin: 5px 0; font-size: 14px;">{custom_url}</p>
+        <p style="color: #545454; margin: 10px 0 0 0; font-size: 13px;">{meta_display}</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Length indicators
+    col1, col2 = st.columns(2)
+    with col1:
+        title_status = "✅" if 50 <= len(custom_title) <= 60 else "⚠️"
+        st.write(f"{title_status} Title: {len(custom_title)} characters")
+
+    with col2:
+        meta_status = "✅" if 150 <= len(meta_desc) <= 160 else "⚠️"
+        st.write(f"{meta_status} Meta: {len(meta_desc)} characters")
+
+@st.fragment
+def api_status():
+    """Static API status block - a fragment, so it is rebuilt in isolation
+    and never re-rendered as part of a full-page rerun"""
+    st.subheader("🌐 API Status")
+    # One markdown table instead of three columns of success/caption
+    # pairs - a single element for the front end to render
+    st.markdown(
+        "| API | Status |\n"
+        "|---|---|\n"
+        "| Google Autocomplete | ✅ Real search suggestions |\n"
+        "| Datamuse API | ✅ Semantic relationships |\n"
+        "| Wikipedia API | ✅ Related concepts |"
+    )
+
+def main():
+    # Initialize analyzer
+    if 'analyzer' not in st.session_state:
+        st.session_state.analyzer = RealTimeSEOAnalyzer()
+    
+    analyzer = st.session_state.analyzer
+    
+    # Header
+    st.title("📈 RankBuddy - Real-Time SEO")
+    st.markdown("*Powered by real-time keyword data from Google, Datamuse & Wikipedia APIs*")
+    
+    # Sidebar
+    st.sidebar.header("🎯 Real-Time Keyword Research")
+    st.sidebar.success("✅ Using live API data only")
+    st.sidebar.markdown("**Data Sources:**")
+    st.sidebar.markdown("• Google Autocomplete API")
+    st.sidebar.markdown("• Google Related Searches")
+    st.sidebar.markdown("• Datamuse Semantic API")
+    st.sidebar.markdown("• Wikipedia Search API")
+    
+    # Main input - inside a form so the API pipeline only fires on an
+    # explicit submit, not on every keystroke while the user is typing
+    with st.sidebar.form("keyword_form"):
+        seed_keyword = st.text_input(
+            "Enter your target keyword:",
+            placeholder="e.g., digital marketing",
+            help="Enter the keyword you want to rank for"
+        )
+        submitted = st.form_submit_button("🔍 Analyze")
+
+    if submitted and seed_keyword:
+        # Generate keywords with real-time progress
+        if 'current_keyword' not in st.session_state or st.session_state.current_keyword != seed_keyword:
+            st.session_state.current_keyword = seed_keyword
+
+            with st.spinner('🌐 Fetching real-time keyword data...'):
+                # Generate keywords with their precomputed word counts
+                keyword_counts = analyzer.generate_real_keywords(seed_keyword)
+                st.session_state.all_keywords = [keyword for keyword, _ in keyword_counts]
+                
+                # Categorize keywords
+                short_tail, long_tail = analyzer.categorize_keywords(keyword_counts)
+                st.session_state.short_tail = short_tail
+                st.session_state.long_tail = long_tail
+                
+                # Analyze difficulties
+                st.session_state.difficulties = analyzer.analyze_keyword_difficulty(st.session_state.all_keywords)
+
+                # Bucket the scores into display emojis once, so the keyword
+                # lists render with a dict lookup on every rerun
+                st.session_state.diff_display = {
+                    kw: (d, "🟢" if d < 30 else "🟡" if d < 70 else "🔴")
+                    for kw, d in st.session_state.difficulties.items()
+                }
+
+                # Generate content structure
+                st.session_state.structure = analyzer.suggest_content_structure(seed_keyword, st.session_state.all_keywords)
+
+    if 'current_keyword' in st.session_state:
+        # Render from the last analyzed keyword so later widget
+        # interactions don't depend on the (possibly edited) form field
+        seed_keyword = st.session_state.current_keyword
+
+        # Tabs
+        tab1, tab2, tab3, tab4, tab5 = st.tabs([
+            "🔍 Keywords", "📊 Analysis", "📝 Content", "👀 SERP Preview", "📄 Export"
+        ])
+        
+        with tab1:
+            st.header("Real-Time Keyword Research")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.subheader("Short-Tail Keywords")
+                st.caption(f"Found {len(st.session_state.short_tail)} short-tail keywords")
+                
+                for keyword in st.session_state.short_tail[:15]:
+                    difficulty, color = st.session_state.diff_display.get(keyword, (50, "🟡"))
+                    st.write(f"{color} **{keyword}** (Difficulty: {difficulty:.0f})")
+            
+            with col2:
+                st.subheader("Long-Tail Keywords")
+                st.caption(f"Found {len(st.session_state.long_tail)} long-tail keywords")
+                
+                for keyword in st.session_state.long_tail[:15]:
+                    difficulty, color = st.session_state.diff_display.get(keyword, (50, "🟡"))
+                    st.write(f"{color} **{keyword}** (Difficulty: {difficulty:.0f})")
+        
+        with tab2:
+            # Deferred imports - only paid for when the Analysis tab is
+            # actually rendered, keeping cold start lean
+            import numpy as np
+            import pandas as pd
+
+            st.header("Keyword Analysis")
+
+            # Get difficulty values as an array so all the stats below are
+            # single C-level passes instead of Python generator loops
+            all_difficulties = np.fromiter(st.session_state.difficulties.values(), dtype=np.float32)
+
+            col1, col2 = st.columns(2)
+
+            with col1:
+                # Difficulty distribution chart - precomputed bins rendered
+                # natively, no matplotlib figure rasterization per rerun
+                st.subheader("Difficulty Distribution")
+                counts, edges = np.histogram(all_difficulties, bins=15)
+                hist_df = pd.DataFrame({
+                    'Difficulty Score': (edges[:-1] + edges[1:]) / 2,
+                    'Number of Keywords': counts
+                })
+                st.bar_chart(hist_df, x='Difficulty Score', y='Number of Keywords')
+
+            with col2:
+                st.subheader("Live Metrics")
+
+                avg_difficulty = all_difficulties.mean()
+                st.metric("Average Difficulty", f"{avg_difficulty:.1f}")
+
+                easy_count = int((all_difficulties < 30).sum())
+                st.metric("Easy Keywords", easy_count)
+
+                medium_count = int(((all_difficulties >= 30) & (all_difficulties < 70)).sum())
+                st.metric("Medium Keywords", medium_count)
+
+                hard_count = int((all_difficulties >= 70).sum())
+                st.metric("Hard Keywords", hard_count)
+                
+                st.subheader("Recommendations")
+                if easy_count > 5:
+                    st.success("✅ Great! You have many easy keywords to target.")
+                elif medium_count > easy_count:
+                    st.warning("⚠️ Focus on medium difficulty keywords for quick wins.")
+                else:
+                    st.info("💡 Consider more specific long-tail variations.")
+        
+        with tab3:
+            st.header("Content Structure")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.subheader("Title Suggestions")
+                for i, title in enumerate(st.session_state.structure['titles']):
+                    st.write(f"**{i+1}.** {title}")
+                
+                st.subheader("Content Guidelines")
+                st.write(f"**Target Length:** {st.session_state.structure['target_length']:,} words")
+                st.write(f"**Keyword Density:** {st.session_state.structure['keyword_density']}%")
+                
+                keyword_mentions = int(st.session_state.structure['target_length'] * st.session_state.structure['keyword_density'] / 100)
+                st.write(f"**Target Mentions:** {keyword_mentions} times")
+            
+            with col2:
+                st.subheader("Suggested Headings")
+                for heading in st.session_state.structure['headings']:
+                    st.write(f"• {heading}")
+                
+                st.subheader("Meta Description")
+                st.info(st.session_state.structure['meta_description'])
+        
+        with tab4:
+            serp_preview(st.session_state.structure, seed_keyword)
+        
+        with tab5:
+            st.header("Export Research")
+            
+            # Add tabs for different export options
+            export_tab1, export_tab2 = st.tabs(["📄 SEO Data", "🤖 AI Blog Prompt"])
+            
+            with export_tab1:
+                st.subheader("Export SEO Research Data")
+                export_format = st.selectbox("Format:", ["Markdown", "Text", "JSON"])
+                
+                if st.button("Generate SEO Export"):
+                    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                    
+                    if export_format == "Markdown":
+                        # Collect parts and join once - avoids quadratic
+                        # string concatenation in the keyword loops
+                        parts = [f"""# Real-Time SEO Research: {seed_keyword.title()}
+
+Generated: {timestamp}
+
+## Keywords Found
+- **Total Keywords:** {len(st.session_state.all_keywords)}
+- **Short-tail:** {len(st.session_state.short_tail)}
+- **Long-tail:** {len(st.session_state.long_tail)}
+
+### Top Short-Tail Keywords
+"""]
+                        for kw in st.session_state.short_tail[:10]:
+                            diff = st.session_state.difficulties.get(kw, 50)
+                            parts.append(f"- **{kw}** (Difficulty: {diff:.0f})\n")
+
+                        parts.append("\n### Top Long-Tail Keywords\n")
+                        for kw in st.session_state.long_tail[:15]:
+                            diff = st.session_state.difficulties.get(kw, 50)
+                            parts.append(f"- **{kw}** (Difficulty: {diff:.0f})\n")
+
+                        parts.append(f"""
+## Content Strategy
+### Recommended Title
+{st.session_state.structure['titles'][0]}
+
+### Meta Description
+{st.session_state.structure['meta_description']}
+
+### Content Structure
+""")
+                        for heading in st.session_state.structure['headings']:
+                            parts.append(f"- {heading}\n")
+
+                        parts.append(f"""
+## SEO Guidelines
+- Target Length: {st.session_state.structure['target_length']:,} words
+- Keyword Density: {st.session_state.structure['keyword_density']}%
+- Focus on easy-difficulty keywords first
+- Use long-tail keywords in subheadings
+
+---
+*Generated by RankBuddy Real-Time SEO Analyzer*
+""")
+                        content = "".join(parts)
+                    
+                    elif export_format == "JSON":
+                        content = orjson.dumps({
+                            'keyword': seed_keyword,
+                            'timestamp': timestamp,
+                            'short_tail_keywords': st.session_state.short_tail,
+                            'long_tail_keywords': st.session_state.long_tail,
+                            'difficulties': st.session_state.difficulties,
+                            'content_structure': st.session_state.structure
+                        }, option=orjson.OPT_INDENT_2).decode()
+                    
+                    else:  # Text format
+                        parts = [f"""REAL-TIME SEO RESEARCH: {seed_keyword.upper()}
+Generated: {timestamp}
+
+KEYWORDS FOUND:
+Total: {len(st.session_state.all_keywords)}
+Short-tail: {len(st.session_state.short_tail)}
+Long-tail: {len(st.session_state.long_tail)}
+
+TOP KEYWORDS:
+"""]
+                        for kw in st.session_state.all_keywords[:20]:
+                            diff = st.session_state.difficulties.get(kw, 50)
+                            parts.append(f"- {kw} (Difficulty: {diff:.0f})\n")
+                        content = "".join(parts)
+                    
+                    st.download_button(
+                        label=f"Download {export_format}",
+                        data=content,
+                        file_name=f"rankbuddy_realtime_{seed_keyword.replace(' ', '_')}.{export_format.lower()}",
+                        mime="text/plain"
+                    )
+                    
+                    st.code(content, language=export_format.lower())
+            
+            with export_tab2:
+                st.subheader("🤖 AI Blog Writing Prompt")
+                st.markdown("*Copy this prompt and paste it into ChatGPT, Claude, or any AI writing tool*")
+                
+                # Generate the AI prompt
+                def generate_ai_prompt():
+                    # Get best keywords (easy difficulty first)
+                    easy_keywords = [kw for kw, diff in st.session_state.difficulties.items() if diff < 30]
+                    medium_keywords = [kw for kw, diff in st.session_state.difficulties.items() if 30 <= diff < 50]
+                    
+                    # Select best secondary keywords
+                    secondary_keywords = (easy_keywords[:8] + medium_keywords[:5])[:12]
+                    secondary_keywords_str = ", ".join(secondary_keywords)
+                    
+                    # Calculate target word count and keyword mentions
+                    target_words = st.session_state.structure['target_length']
+                    keyword_density = st.session_state.structure['keyword_density']
+                    target_mentions = int(target_words * keyword_density / 100)
+                    
+                    heading_parts = []
+                    for i, heading in enumerate(st.session_state.structure['headings'], 1):
+                        tier = min(i - 1, 2) if i <= 4 else 3
+                        heading_parts.append(f"\n**H{2 if i <= 4 else 3}. {heading}**")
+                        heading_parts.append(_TIER_BULLETS[tier])
+
+                    return AI_PROMPT_TEMPLATE.format_map({
+                        'seed_keyword': seed_keyword,
+                        'secondary_keywords': secondary_keywords_str,
+                        'target_words': target_words,
+                        'keyword_density': keyword_density,
+                        'target_mentions': target_mentions,
+                        'suggested_title': st.session_state.structure['titles'][0],
+                        'meta_description': st.session_state.structure['meta_description'],
+                        'heading_sections': "".join(heading_parts)
+                    })
+                
+                # Generate and display the prompt
+                ai_prompt = generate_ai_prompt()
+                
+                # Show the prompt as a static code block - it renders once
+                # with a built-in copy button, instead of pushing the whole
+                # 4KB string through the text_area rerender path on every
+                # interaction
+                st.markdown("**Complete AI Writing Prompt:**")
+                st.code(ai_prompt, language="markdown")
+                st.caption("Copy this entire prompt and paste it into ChatGPT, Claude, or your preferred AI writing tool")
+                
+                # Download button for the prompt
+                st.download_button(
+                    label="📄 Download AI Prompt",
+                    data=ai_prompt,
+                    file_name=f"ai_blog_prompt_{seed_keyword.replace(' ', '_')}.txt",
+                    mime="text/plain"
+                )
+                
+                # Quick copy instructions
+                st.info("💡 **How to use:** Copy the prompt above, paste it into ChatGPT or any AI writing tool, and get a perfectly optimized blog post!")
+                
+                # Additional customization options
+                customize_prompt(ai_prompt, st.session_state.structure['target_length'], seed_keyword)
+
+    else:
+        st.info("👆 Enter a keyword in the sidebar to start real-time analysis")
+
+        # Show API status
+        api_status()
+
+if __name__ == "__main__":
+    main()
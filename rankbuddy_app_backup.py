@@ -1,838 +1,1003 @@
-import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
-from collections import Counter, defaultdict
-import re
-import os
-from scipy.spatial.distance import cosine
-import difflib
-import math
-from datetime import datetime
-import requests
-
-# Set page config
-st.set_page_config(
-    page_title="RankBuddy - SEO Optimizer",
-    page_icon="📈",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-class KeywordAPI:
-    """Free API integration for real keyword data"""
-    
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        })
-    
-    def get_google_suggestions(self, keyword):
-        """Get Google autocomplete suggestions for keyword"""
-        try:
-            url = "http://suggestqueries.google.com/complete/search"
-            params = {
-                'client': 'firefox',
-                'q': keyword,
-                'hl': 'en'
-            }
-            response = self.session.get(url, params=params, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                if len(data) > 1 and isinstance(data[1], list):
-                    return [suggestion for suggestion in data[1] if suggestion and len(suggestion) > 2]
-            return []
-        except Exception as e:
-            st.warning(f"Google Suggestions API error: {str(e)}")
-            return []
-    
-    def get_related_keywords_from_datamuse(self, keyword):
-        """Get related keywords from Datamuse API (free)"""
-        try:
-            # Get words with similar meaning
-            url = "https://api.datamuse.com/words"
-            params = {
-                'ml': keyword,  # similar meaning
-                'max': 20
-            }
-            response = self.session.get(url, params=params, timeout=10)
-            related_words = []
-            
-            if response.status_code == 200:
-                data = response.json()
-                related_words.extend([item['word'] for item in data])
-            
-            # Get words that often appear with this word
-            params = {
-                'rel_trg': keyword,  # words that often follow
-                'max': 15
-            }
-            response = self.session.get(url, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                related_words.extend([item['word'] for item in data])
-            
-            return list(set(related_words))[:25]  # Remove duplicates and limit
-            
-        except Exception as e:
-            st.warning(f"Datamuse API error: {str(e)}")
-            return []
-    
-    def get_wiki_related_terms(self, keyword):
-        """Get related terms from Wikipedia API (free)"""
-        try:
-            # Search Wikipedia for the keyword
-            url = "https://en.wikipedia.org/api/rest_v1/page/summary/" + keyword.replace(' ', '_')
-            response = self.session.get(url, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                extract = data.get('extract', '')
-                
-                # Extract important terms from the summary
-                words = re.findall(r'\b[A-Za-z]{4,}\b', extract.lower())
-                # Filter out common words and return unique terms
-                stopwords = {'that', 'with', 'have', 'this', 'will', 'from', 'they', 'been', 'were', 'said', 'each', 'which', 'their', 'time', 'also', 'more', 'very', 'what', 'know', 'just', 'first', 'into', 'over', 'think', 'than', 'only', 'come', 'year', 'work', 'such', 'make', 'them', 'well', 'were'}
-                filtered_words = [word for word in set(words) if len(word) > 4 and word not in stopwords]
-                return filtered_words[:15]
-            
-            return []
-            
-        except Exception as e:
-            st.warning(f"Wikipedia API error: {str(e)}")
-            return []
-    
-    def estimate_real_difficulty(self, keyword):
-        """Estimate difficulty based on real search data"""
-        try:
-            # Use Google search to estimate competition
-            url = "https://www.google.com/search"
-            params = {
-                'q': f'"{keyword}"',  # Exact phrase search
-                'num': 1
-            }
-            
-            response = self.session.get(url, params=params, timeout=10)
-            
-            if response.status_code == 200:
-                # Extract approximate result count from the page
-                content = response.text
-                # Look for result count patterns
-                import re
-                result_patterns = [
-                    r'About ([\d,]+) results',
-                    r'([\d,]+) results',
-                    r'Approximately ([\d,]+) results'
-                ]
-                
-                for pattern in result_patterns:
-                    match = re.search(pattern, content)
-                    if match:
-                        result_count = int(match.group(1).replace(',', ''))
-                        # Convert to difficulty score (0-100)
-                        if result_count < 10000:
-                            return min(20, max(5, result_count / 500))  # Very easy
-                        elif result_count < 100000:
-                            return min(40, max(20, result_count / 2500))  # Easy
-                        elif result_count < 1000000:
-                            return min(60, max(40, result_count / 16667))  # Medium
-                        elif result_count < 10000000:
-                            return min(80, max(60, result_count / 125000))  # Hard
-                        else:
-                            return min(95, max(80, result_count / 1000000))  # Very hard
-            
-            # Fallback to heuristic scoring
-            words = keyword.lower().split()
-            word_count = len(words)
-            avg_length = sum(len(word) for word in words) / len(words) if words else 0
-            
-            # Base difficulty on length and word count
-            base_score = max(0, 50 - (word_count * 8) - (avg_length * 2))
-            return min(100, max(10, base_score))
-            
-        except Exception as e:
-            # Fallback to simple heuristic
-            words = keyword.lower().split()
-            word_count = len(words)
-            avg_length = sum(len(word) for word in words) / len(words) if words else 0
-            base_score = max(0, 50 - (word_count * 8) - (avg_length * 2))
-            return min(100, max(10, base_score))
-
-class SEOAnalyzer:
-    def __init__(self):
-        self.common_words = self.load_common_words()
-        self.stopwords = self.load_stopwords()
-        self.word_frequencies = self.load_word_frequencies()
-        self.api = KeywordAPI()
-        
-    def load_common_words(self):
-        """Load common English words for keyword generation"""
-        # Common English words that are often used in blog posts
-        return {
-            'how', 'what', 'why', 'when', 'where', 'guide', 'tutorial', 'tips',
-            'best', 'top', 'review', 'comparison', 'vs', 'versus', 'ultimate',
-            'complete', 'beginner', 'advanced', 'step', 'steps', 'easy', 'simple',
-            'quick', 'fast', 'effective', 'proven', 'examples', 'case', 'study',
-            'free', 'tools', 'software', 'app', 'platform', 'service', 'solution',
-            'strategy', 'method', 'technique', 'approach', 'way', 'ways', 'ideas',
-            'checklist', 'framework', 'process', 'system', 'hack', 'hacks',
-            'secret', 'secrets', 'trick', 'tricks', 'mistake', 'mistakes',
-            'common', 'popular', 'trending', 'latest', 'new', 'updated', 'modern',
-            'business', 'marketing', 'growth', 'success', 'profitable', 'money',
-            'startup', 'entrepreneur', 'founder', 'indie', 'solo', 'small',
-            'online', 'digital', 'internet', 'web', 'website', 'blog', 'content',
-            'seo', 'optimization', 'rank', 'ranking', 'google', 'search', 'traffic'
-        }
-    
-    def load_stopwords(self):
-        """Load stopwords to filter out"""
-        return {
-            'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from',
-            'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the',
-            'to', 'was', 'will', 'with', 'or', 'but', 'if', 'then', 'than',
-            'this', 'these', 'they', 'them', 'their', 'there', 'we', 'you',
-            'your', 'i', 'me', 'my', 'mine', 'our', 'ours', 'us'
-        }
-    
-    def load_word_frequencies(self):
-        """Load word frequency data for difficulty estimation"""
-        # Simulated frequency data based on common patterns
-        base_freq = {
-            'how': 850000, 'what': 750000, 'best': 680000, 'top': 620000,
-            'guide': 450000, 'tips': 380000, 'review': 320000, 'free': 280000,
-            'tutorial': 240000, 'business': 220000, 'marketing': 180000,
-            'seo': 160000, 'growth': 140000, 'startup': 120000, 'tools': 110000,
-            'strategy': 95000, 'success': 85000, 'online': 75000, 'digital': 65000,
-            'beginner': 55000, 'advanced': 45000, 'complete': 40000, 'ultimate': 35000,
-            'simple': 30000, 'easy': 28000, 'quick': 25000, 'step': 22000,
-            'effective': 20000, 'proven': 18000, 'examples': 16000, 'case': 15000,
-            'study': 14000, 'method': 13000, 'technique': 12000, 'approach': 11000,
-            'framework': 10000, 'process': 9500, 'system': 9000, 'hack': 8500,
-            'secret': 8000, 'trick': 7500, 'mistake': 7000, 'common': 6500,
-            'popular': 6000, 'trending': 5500, 'latest': 5000, 'new': 4800,
-            'updated': 4600, 'modern': 4400, 'profitable': 4200, 'money': 4000,
-            'entrepreneur': 3800, 'founder': 3600, 'indie': 3400, 'solo': 3200,
-            'small': 3000, 'website': 2800, 'blog': 2600, 'content': 2400,
-            'optimization': 2200, 'rank': 2000, 'ranking': 1800, 'google': 1600,
-            'search': 1400, 'traffic': 1200, 'conversion': 1000, 'funnel': 900,
-            'leads': 800, 'sales': 700, 'revenue': 600, 'profit': 500
-        }
-        return base_freq
-    
-    def generate_related_keywords(self, seed_keyword, max_keywords=20, use_api=True):
-        """Generate related keywords using both offline analysis and real API data"""
-        seed_words = self.clean_text(seed_keyword).split()
-        related_keywords = set()
-        
-        # Add seed keyword
-        related_keywords.add(seed_keyword.lower())
-        
-        # Get real data from APIs if enabled
-        if use_api:
-            try:
-                # Get Google autocomplete suggestions
-                google_suggestions = self.api.get_google_suggestions(seed_keyword)
-                related_keywords.update(google_suggestions)
-                
-                # Get related words from Datamuse API
-                datamuse_words = self.api.get_related_keywords_from_datamuse(seed_keyword)
-                for word in datamuse_words:
-                    related_keywords.add(f"{word} {seed_keyword}")
-                    related_keywords.add(f"{seed_keyword} {word}")
-                    related_keywords.add(word)
-                
-                # Get Wikipedia related terms
-                wiki_terms = self.api.get_wiki_related_terms(seed_keyword)
-                for term in wiki_terms:
-                    related_keywords.add(f"{term} {seed_keyword}")
-                    related_keywords.add(f"{seed_keyword} {term}")
-                
-            except Exception as e:
-                st.warning(f"API fetch error, using offline data: {str(e)}")
-        
-        # Generate combinations with common SEO words (offline backup)
-        for word in seed_words:
-            for common_word in self.common_words:
-                # Prefix combinations
-                related_keywords.add(f"{common_word} {word}")
-                related_keywords.add(f"{common_word} {seed_keyword}")
-                # Suffix combinations
-                related_keywords.add(f"{word} {common_word}")
-                related_keywords.add(f"{seed_keyword} {common_word}")
-        
-        # Generate long-tail variations
-        long_tail_modifiers = [
-            "for beginners", "step by step", "in 2024", "complete guide",
-            "best practices", "case study", "examples", "tutorial",
-            "how to", "why you need", "mistakes to avoid", "tips and tricks",
-            "free", "online", "software", "tools", "strategy", "tips"
-        ]
-        
-        for modifier in long_tail_modifiers:
-            related_keywords.add(f"{seed_keyword} {modifier}")
-            related_keywords.add(f"{modifier} {seed_keyword}")
-        
-        # Filter and sort by relevance
-        filtered_keywords = []
-        for keyword in related_keywords:
-            if len(keyword.split()) <= 6 and len(keyword) >= 3:
-                similarity = self.calculate_similarity(seed_keyword, keyword)
-                filtered_keywords.append((keyword, similarity))
-        
-        # Sort by similarity and return top keywords
-        filtered_keywords.sort(key=lambda x: x[1], reverse=True)
-        return [kw[0] for kw in filtered_keywords[:max_keywords * 2]]  # Return more keywords since we have better data
-    
-    def calculate_similarity(self, text1, text2):
-        """Calculate similarity between two text strings"""
-        return difflib.SequenceMatcher(None, text1.lower(), text2.lower()).ratio()
-    
-    def clean_text(self, text):
-        """Clean text for analysis"""
-        # Remove special characters and convert to lowercase
-        text = re.sub(r'[^a-zA-Z0-9\s]', '', text.lower())
-        return text
-    
-    def estimate_keyword_difficulty(self, keyword):
-        """Estimate keyword difficulty using heuristics"""
-        words = self.clean_text(keyword).split()
-        
-        # Factors affecting difficulty
-        word_count = len(words)
-        avg_word_length = sum(len(word) for word in words) / len(words) if words else 0
-        
-        # Check word frequency
-        total_frequency = 0
-        for word in words:
-            if word in self.word_frequencies:
-                total_frequency += self.word_frequencies[word]
-        
-        # Calculate difficulty score (0-100)
-        # Higher frequency = higher difficulty
-        frequency_score = min(total_frequency / 10000, 50)  # Cap at 50
-        
-        # Longer phrases are generally easier
-        length_score = max(0, 30 - (word_count * 5))
-        
-        # Longer words are generally more specific (easier)
-        word_length_score = max(0, 20 - (avg_word_length * 2))
-        
-        difficulty = frequency_score + length_score + word_length_score
-        return min(max(difficulty, 0), 100)  # Clamp between 0-100
-    
-    def suggest_blog_structure(self, keyword, related_keywords):
-        """Suggest blog post structure based on keyword analysis"""
-        structure = {
-            'title_suggestions': [],
-            'headings': [],
-            'meta_description': '',
-            'keyword_density': 0.015,  # 1.5%
-            'word_count_target': 1500
-        }
-        
-        # Title suggestions
-        title_templates = [
-            f"The Ultimate Guide to {keyword.title()}",
-            f"How to {keyword.title()}: Complete Tutorial",
-            f"{keyword.title()}: Best Practices and Tips",
-            f"Everything You Need to Know About {keyword.title()}",
-            f"{keyword.title()} for Beginners: Step-by-Step Guide"
-        ]
-        structure['title_suggestions'] = title_templates
-        
-        # Heading structure
-        headings = [
-            f"What is {keyword.title()}?",
-            f"Why {keyword.title()} Matters",
-            f"How to Get Started with {keyword.title()}",
-            f"Best Practices for {keyword.title()}",
-            f"Common Mistakes to Avoid",
-            f"Tools and Resources",
-            f"Case Studies and Examples",
-            f"Conclusion"
-        ]
-        structure['headings'] = headings
-        
-        # Meta description
-        structure['meta_description'] = f"Learn everything about {keyword} with our comprehensive guide. Discover best practices, tips, and strategies to master {keyword} today."
-        
-        return structure
-    
-    def generate_seo_checklist(self, keyword, title, meta_description):
-        """Generate on-page SEO checklist"""
-        checklist = {
-            'title_tag': [],
-            'meta_description': [],
-            'headings': [],
-            'content': [],
-            'technical': [],
-            'url': []
-        }
-        
-        # Title tag checks
-        title_length = len(title)
-        checklist['title_tag'].append(f"✓ Title length: {title_length} characters (ideal: 50-60)")
-        if keyword.lower() in title.lower():
-            checklist['title_tag'].append("✓ Primary keyword included in title")
-        else:
-            checklist['title_tag'].append("✗ Include primary keyword in title")
-        
-        # Meta description checks
-        meta_length = len(meta_description)
-        checklist['meta_description'].append(f"✓ Meta description length: {meta_length} characters (ideal: 150-160)")
-        if keyword.lower() in meta_description.lower():
-            checklist['meta_description'].append("✓ Primary keyword included in meta description")
-        else:
-            checklist['meta_description'].append("✗ Include primary keyword in meta description")
-        
-        # Heading checks
-        checklist['headings'].extend([
-            "✓ Use H1 for main title",
-            "✓ Include keyword in H1",
-            "✓ Use H2 for main sections",
-            "✓ Use H3 for subsections",
-            "✓ Include related keywords in headings"
-        ])
-        
-        # Content checks
-        checklist['content'].extend([
-            "✓ Keyword density: 1-2% of total content",
-            "✓ Include keyword in first paragraph",
-            "✓ Use related keywords naturally",
-            "✓ Add internal links to relevant pages",
-            "✓ Include external links to authoritative sources",
-            "✓ Add alt text to all images",
-            "✓ Use bullet points and numbered lists",
-            "✓ Keep paragraphs short (2-3 sentences)"
-        ])
-        
-        # Technical checks
-        checklist['technical'].extend([
-            "✓ Page loads in under 3 seconds",
-            "✓ Mobile-responsive design",
-            "✓ HTTPS enabled",
-            "✓ Proper URL structure",
-            "✓ Schema markup implemented",
-            "✓ XML sitemap updated"
-        ])
-        
-        # URL checks
-        suggested_url = self.generate_url_slug(keyword)
-        checklist['url'].append(f"✓ Suggested URL: /{suggested_url}")
-        checklist['url'].extend([
-            "✓ Include primary keyword in URL",
-            "✓ Use hyphens to separate words",
-            "✓ Keep URL under 60 characters",
-            "✓ Avoid special characters and numbers"
-        ])
-        
-        return checklist
-    
-    def generate_url_slug(self, keyword):
-        """Generate URL slug from keyword"""
-        slug = self.clean_text(keyword)
-        slug = re.sub(r'\s+', '-', slug)
-        return slug
-    
-    def preview_serp_snippet(self, title, meta_description, url):
-        """Generate SERP snippet preview"""
-        # Truncate title if too long
-        display_title = title[:60] + "..." if len(title) > 60 else title
-        
-        # Truncate meta description if too long
-        display_meta = meta_description[:160] + "..." if len(meta_description) > 160 else meta_description
-        
-        return {
-            'title': display_title,
-            'url': url,
-            'meta_description': display_meta,
-            'title_length': len(title),
-            'meta_length': len(meta_description)
-        }
-
-def main():
-    # Initialize SEO analyzer
-    if 'seo_analyzer' not in st.session_state:
-        st.session_state.seo_analyzer = SEOAnalyzer()
-    
-    seo_analyzer = st.session_state.seo_analyzer
-    
-    # Header
-    st.title("📈 RankBuddy")
-    st.markdown("*Your AI-free SEO companion for indie hackers and solo founders*")
-    
-    # Sidebar
-    st.sidebar.header("🎯 SEO Research")
-    
-    # API Toggle
-    use_apis = st.sidebar.checkbox(
-        "🌐 Use Free APIs for Real Data",
-        value=True,
-        help="Enable to get real keyword suggestions from Google, Datamuse, and Wikipedia APIs (free)"
-    )
-    
-    if use_apis:
-        st.sidebar.success("✅ Real-time keyword data enabled")
-        st.sidebar.markdown("**Data Sources:**")
-        st.sidebar.markdown("• Google Autocomplete")
-        st.sidebar.markdown("• Datamuse API")
-        st.sidebar.markdown("• Wikipedia API")
-    else:
-        st.sidebar.info("📴 Using offline data only")
-    
-    # Main input
-    seed_keyword = st.sidebar.text_input(
-        "Enter your seed keyword/topic:",
-        placeholder="e.g., content marketing for startups",
-        help="Enter the main topic you want to write about"
-    )
-    
-    if seed_keyword:
-        # Store data in session state
-        if 'current_keyword' not in st.session_state or st.session_state.current_keyword != seed_keyword or st.session_state.get('use_apis', True) != use_apis:
-            st.session_state.current_keyword = seed_keyword
-            st.session_state.use_apis = use_apis
-            
-            # Show loading message when using APIs
-            if use_apis:
-                with st.spinner('🔍 Fetching real keyword data from APIs...'):
-                    st.session_state.related_keywords = seo_analyzer.generate_related_keywords(seed_keyword, use_api=use_apis)
-            else:
-                st.session_state.related_keywords = seo_analyzer.generate_related_keywords(seed_keyword, use_api=use_apis)
-            
-            st.session_state.blog_structure = seo_analyzer.suggest_blog_structure(seed_keyword, st.session_state.related_keywords)
-        
-        # Tabs for different features
-        tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
-            "🔍 Keywords", "📊 Analysis", "📝 Structure", "✅ SEO Checklist", "👀 SERP Preview", "📄 Export"
-        ])
-        
-        with tab1:
-            st.header("Keyword Research")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.subheader("Related Keywords")
-                for i, keyword in enumerate(st.session_state.related_keywords[:10]):
-                    difficulty = seo_analyzer.estimate_keyword_difficulty(keyword)
-                    difficulty_color = "🟢" if difficulty < 30 else "🟡" if difficulty < 70 else "🔴"
-                    st.write(f"{difficulty_color} **{keyword}** (Difficulty: {difficulty:.0f})")
-            
-            with col2:
-                st.subheader("Long-tail Variations")
-                long_tail = [kw for kw in st.session_state.related_keywords if len(kw.split()) > 3]
-                for keyword in long_tail[:10]:
-                    difficulty = seo_analyzer.estimate_keyword_difficulty(keyword)
-                    difficulty_color = "🟢" if difficulty < 30 else "🟡" if difficulty < 70 else "🔴"
-                    st.write(f"{difficulty_color} **{keyword}** (Difficulty: {difficulty:.0f})")
-        
-        with tab2:
-            st.header("Keyword Analysis")
-            
-            # Difficulty analysis
-            difficulties = [seo_analyzer.estimate_keyword_difficulty(kw) for kw in st.session_state.related_keywords[:15]]
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.subheader("Difficulty Distribution")
-                fig, ax = plt.subplots(figsize=(8, 6))
-                ax.hist(difficulties, bins=10, color='skyblue', alpha=0.7, edgecolor='black')
-                ax.set_xlabel('Difficulty Score')
-                ax.set_ylabel('Number of Keywords')
-                ax.set_title('Keyword Difficulty Distribution')
-                st.pyplot(fig)
-            
-            with col2:
-                st.subheader("Keyword Metrics")
-                avg_difficulty = np.mean(difficulties)
-                st.metric("Average Difficulty", f"{avg_difficulty:.1f}")
-                
-                easy_keywords = sum(1 for d in difficulties if d < 30)
-                st.metric("Easy Keywords", f"{easy_keywords}")
-                
-                hard_keywords = sum(1 for d in difficulties if d > 70)
-                st.metric("Hard Keywords", f"{hard_keywords}")
-        
-        with tab3:
-            st.header("Blog Post Structure")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.subheader("Title Suggestions")
-                for i, title in enumerate(st.session_state.blog_structure['title_suggestions']):
-                    st.write(f"**{i+1}.** {title}")
-                
-                st.subheader("Content Guidelines")
-                st.write(f"**Target word count:** {st.session_state.blog_structure['word_count_target']:,} words")
-                st.write(f"**Keyword density:** {st.session_state.blog_structure['keyword_density']:.1%}")
-                
-                keyword_count = int(st.session_state.blog_structure['word_count_target'] * st.session_state.blog_structure['keyword_density'])
-                st.write(f"**Target keyword mentions:** {keyword_count} times")
-            
-            with col2:
-                st.subheader("Suggested Headings")
-                for i, heading in enumerate(st.session_state.blog_structure['headings']):
-                    level = "H2" if i == 0 else "H3"
-                    st.write(f"**{level}:** {heading}")
-                
-                st.subheader("Meta Description")
-                st.info(st.session_state.blog_structure['meta_description'])
-        
-        with tab4:
-            st.header("SEO Checklist")
-            
-            # Get user inputs for checklist
-            user_title = st.text_input("Your blog post title:", value=st.session_state.blog_structure['title_suggestions'][0])
-            user_meta = st.text_area("Your meta description:", value=st.session_state.blog_structure['meta_description'])
-            
-            if user_title and user_meta:
-                checklist = seo_analyzer.generate_seo_checklist(seed_keyword, user_title, user_meta)
-                
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.subheader("Title & Meta")
-                    for item in checklist['title_tag']:
-                        st.write(item)
-                    st.write("")
-                    for item in checklist['meta_description']:
-                        st.write(item)
-                    
-                    st.subheader("Headings")
-                    for item in checklist['headings']:
-                        st.write(item)
-                
-                with col2:
-                    st.subheader("Content")
-                    for item in checklist['content']:
-                        st.write(item)
-                    
-                    st.subheader("Technical")
-                    for item in checklist['technical']:
-                        st.write(item)
-                    
-                    st.subheader("URL")
-                    for item in checklist['url']:
-                        st.write(item)
-        
-        with tab5:
-            st.header("SERP Preview")
-            
-            # User inputs
-            preview_title = st.text_input("Title:", value=st.session_state.blog_structure['title_suggestions'][0])
-            preview_meta = st.text_area("Meta Description:", value=st.session_state.blog_structure['meta_description'])
-            preview_url = st.text_input("URL:", value=f"https://yourblog.com/{seo_analyzer.generate_url_slug(seed_keyword)}")
-            
-            if preview_title and preview_meta and preview_url:
-                snippet = seo_analyzer.preview_serp_snippet(preview_title, preview_meta, preview_url)
-                
-                # SERP preview styling
-                st.markdown("""
-                <div style="border: 1px solid #ddd; padding: 20px; border-radius: 8px; background-color: #f9f9f9; margin: 20px 0;">
-                    <h3 style="color: #1a0dab; margin: 0; font-size: 20px; line-height: 1.3;">
-                        {title}
-                    </h3>
-                    <p style="color: #006621; margin: 5px 0; font-size: 14px;">
-                        {url}
-                    </p>
-                    <p style="color: #545454; margin: 10px 0 0 0; font-size: 13px; line-height: 1.4;">
-                        {meta_description}
-                    </p>
-                </div>
-                """.format(
-                    title=snippet['title'],
-                    url=snippet['url'],
-                    meta_description=snippet['meta_description']
-                ), unsafe_allow_html=True)
-                
-                # Length warnings
-                col1, col2 = st.columns(2)
-                with col1:
-                    title_status = "✅" if 50 <= snippet['title_length'] <= 60 else "⚠️"
-                    st.write(f"{title_status} Title: {snippet['title_length']} characters")
-                
-                with col2:
-                    meta_status = "✅" if 150 <= snippet['meta_length'] <= 160 else "⚠️"
-                    st.write(f"{meta_status} Meta: {snippet['meta_length']} characters")
-        
-        with tab6:
-            st.header("Export SEO Research")
-            
-            export_format = st.selectbox("Choose export format:", ["Markdown", "Text"])
-            
-            if st.button("Generate Export"):
-                if export_format == "Markdown":
-                    content = generate_markdown_export(seed_keyword, st.session_state.related_keywords, 
-                                                     st.session_state.blog_structure, seo_analyzer)
-                else:
-                    content = generate_text_export(seed_keyword, st.session_state.related_keywords,
-                                                 st.session_state.blog_structure, seo_analyzer)
-                
-                st.download_button(
-                    label=f"Download {export_format} file",
-                    data=content,
-                    file_name=f"rankbuddy_seo_research_{seed_keyword.replace(' ', '_')}.{'md' if export_format == 'Markdown' else 'txt'}",
-                    mime="text/plain"
-                )
-                
-                st.code(content, language='markdown' if export_format == 'Markdown' else 'text')
-
-def generate_markdown_export(keyword, related_keywords, structure, analyzer):
-    """Generate Markdown export of SEO research"""
-    content = f"""# SEO Research Report: {keyword.title()}
-
-Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## Keywords Analysis
-
-### Primary Keyword
-**{keyword}** (Difficulty: {analyzer.estimate_keyword_difficulty(keyword):.0f})
-
-### Related Keywords
-"""
-    
-    for kw in related_keywords[:15]:
-        difficulty = analyzer.estimate_keyword_difficulty(kw)
-        content += f"- **{kw}** (Difficulty: {difficulty:.0f})\n"
-    
-    content += f"""
-## Blog Post Structure
-
-### Title Suggestions
-"""
-    
-    for i, title in enumerate(structure['title_suggestions']):
-        content += f"{i+1}. {title}\n"
-    
-    content += f"""
-### Suggested Headings
-"""
-    
-    for heading in structure['headings']:
-        content += f"- {heading}\n"
-    
-    content += f"""
-### Meta Description
-{structure['meta_description']}
-
-### Content Guidelines
-- **Target word count:** {structure['word_count_target']:,} words
-- **Keyword density:** {structure['keyword_density']:.1%}
-- **Target keyword mentions:** {int(structure['word_count_target'] * structure['keyword_density'])} times
-
-## SEO Checklist
-
-### Title Tag
-- Include primary keyword in title
-- Keep title between 50-60 characters
-- Make it compelling and click-worthy
-
-### Meta Description
-- Include primary keyword
-- Keep between 150-160 characters
-- Write a compelling description that encourages clicks
-
-### Content Optimization
-- Use keyword in first paragraph
-- Maintain 1-2% keyword density
-- Include related keywords naturally
-- Add internal and external links
-- Use proper heading structure (H1, H2, H3)
-- Add alt text to all images
-
-### Technical SEO
-- Ensure fast page load speed
-- Mobile-responsive design
-- HTTPS enabled
-- Proper URL structure
-- Schema markup
-- XML sitemap updated
-
----
-*Generated by RankBuddy - Your AI-free SEO companion*
-"""
-    
-    return content
-
-def generate_text_export(keyword, related_keywords, structure, analyzer):
-    """Generate text export of SEO research"""
-    content = f"""SEO RESEARCH REPORT: {keyword.upper()}
-
-Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-=== KEYWORDS ANALYSIS ===
-
-Primary Keyword: {keyword} (Difficulty: {analyzer.estimate_keyword_difficulty(keyword):.0f})
-
-Related Keywords:
-"""
-    
-    for kw in related_keywords[:15]:
-        difficulty = analyzer.estimate_keyword_difficulty(kw)
-        content += f"- {kw} (Difficulty: {difficulty:.0f})\n"
-    
-    content += f"""
-=== BLOG POST STRUCTURE ===
-
-Title Suggestions:
-"""
-    
-    for i, title in enumerate(structure['title_suggestions']):
-        content += f"{i+1}. {title}\n"
-    
-    content += f"""
-Suggested Headings:
-"""
-    
-    for heading in structure['headings']:
-        content += f"- {heading}\n"
-    
-    content += f"""
-Meta Description:
-{structure['meta_description']}
-
-Content Guidelines:
-- Target word count: {structure['word_count_target']:,} words
-- Keyword density: {structure['keyword_density']:.1%}
-- Target keyword mentions: {int(structure['word_count_target'] * structure['keyword_density'])} times
-
-=== SEO CHECKLIST ===
-
-Title Tag:
-- Include primary keyword in title
-- Keep title between 50-60 characters
-- Make it compelling and click-worthy
-
-Meta Description:
-- Include primary keyword
-- Keep between 150-160 characters
-- Write a compelling description that encourages clicks
-
-Content Optimization:
-- Use keyword in first paragraph
-- Maintain 1-2% keyword density
-- Include related keywords naturally
-- Add internal and external links
-- Use proper heading structure (H1, H2, H3)
-- Add alt text to all images
-
-Technical SEO:
-- Ensure fast page load speed
-- Mobile-responsive design
-- HTTPS enabled
-- Proper URL structure
-- Schema markup
-- XML sitemap updated
-
----
-Generated by RankBuddy - Your AI-free SEO companion
-"""
-    
-    return content
-
-if __name__ == "__main__":
-    main()
+import streamlit as st
+import numpy as np
+import pandas as pd
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import heapq
+import html
+import logging
+import re
+import os
+import math
+import sys
+from datetime import datetime
+from types import MappingProxyType
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional - stdlib json still works, just slower
+    orjson = None
+
+# Set page config
+st.set_page_config(
+    page_title="RankBuddy - SEO Optimizer",
+    page_icon="📈",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+log = logging.getLogger('rankbuddy')
+
+# Patterns compiled once at import - clean_text runs for every keyword in
+# the analysis loops, so re-parsing the patterns per call adds up
+_CLEAN_RE = re.compile(r'[^a-zA-Z0-9\s]')
+# Deletion table for slugs: drop anything that isn't a letter, digit or
+# space in one C-level translate pass
+_SLUG_STRIP_TABLE = {
+    ord(c): None for c in map(chr, range(128))
+    if not (c.isalnum() or c.isspace())
+}
+_WIKI_WORD_RE = re.compile(r'\b[A-Za-z]{4,}\b')
+# Single alternation covering all the result-count phrasings Google uses
+_RESULT_COUNT_RE = re.compile(r'(?:About |Approximately )?([\d,]+) results')
+
+# SERP snippet markup, parsed once at import instead of per rerun
+_SERP_TMPL = """
+<div style="border: 1px solid #ddd; padding: 20px; border-radius: 8px; background-color: #f9f9f9; margin: 20px 0;">
+    <h3 style="color: #1a0dab; margin: 0; font-size: 20px; line-height: 1.3;">
+        {title}
+    </h3>
+    <p style="color: #006621; margin: 5px 0; font-size: 14px;">
+        {url}
+    </p>
+    <p style="color: #545454; margin: 10px 0 0 0; font-size: 13px; line-height: 1.4;">
+        {meta_description}
+    </p>
+</div>
+"""
+
+# Static word data built once per process and shared across analyzer
+# instances (and Streamlit sessions) instead of being rebuilt in __init__
+
+# Common English words that are often used in blog posts
+_COMMON_WORDS = frozenset({
+    'how', 'what', 'why', 'when', 'where', 'guide', 'tutorial', 'tips',
+    'best', 'top', 'review', 'comparison', 'vs', 'versus', 'ultimate',
+    'complete', 'beginner', 'advanced', 'step', 'steps', 'easy', 'simple',
+    'quick', 'fast', 'effective', 'proven', 'examples', 'case', 'study',
+    'free', 'tools', 'software', 'app', 'platform', 'service', 'solution',
+    'strategy', 'method', 'technique', 'approach', 'way', 'ways', 'ideas',
+    'checklist', 'framework', 'process', 'system', 'hack', 'hacks',
+    'secret', 'secrets', 'trick', 'tricks', 'mistake', 'mistakes',
+    'common', 'popular', 'trending', 'latest', 'new', 'updated', 'modern',
+    'business', 'marketing', 'growth', 'success', 'profitable', 'money',
+    'startup', 'entrepreneur', 'founder', 'indie', 'solo', 'small',
+    'online', 'digital', 'internet', 'web', 'website', 'blog', 'content',
+    'seo', 'optimization', 'rank', 'ranking', 'google', 'search', 'traffic'
+})
+
+# Filler words to drop from Wikipedia summaries when mining related terms
+_WIKI_STOPWORDS = frozenset({
+    'that', 'with', 'have', 'this', 'will', 'from', 'they', 'been',
+    'were', 'said', 'each', 'which', 'their', 'time', 'also', 'more',
+    'very', 'what', 'know', 'just', 'first', 'into', 'over', 'think',
+    'than', 'only', 'come', 'year', 'work', 'such', 'make', 'them', 'well'
+})
+
+_STOPWORDS = frozenset({
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from',
+    'has', 'he', 'in', 'is', 'it', 'its', 'of', 'on', 'that', 'the',
+    'to', 'was', 'will', 'with', 'or', 'but', 'if', 'then', 'than',
+    'this', 'these', 'they', 'them', 'their', 'there', 'we', 'you',
+    'your', 'i', 'me', 'my', 'mine', 'our', 'ours', 'us'
+})
+
+# Simulated frequency data based on common patterns; read-only so every
+# session shares the one mapping. Keys are interned so lookups against
+# interned query tokens short-circuit on pointer identity
+_WORD_FREQUENCIES = MappingProxyType({sys.intern(k): v for k, v in {
+    'how': 850000, 'what': 750000, 'best': 680000, 'top': 620000,
+    'guide': 450000, 'tips': 380000, 'review': 320000, 'free': 280000,
+    'tutorial': 240000, 'business': 220000, 'marketing': 180000,
+    'seo': 160000, 'growth': 140000, 'startup': 120000, 'tools': 110000,
+    'strategy': 95000, 'success': 85000, 'online': 75000, 'digital': 65000,
+    'beginner': 55000, 'advanced': 45000, 'complete': 40000, 'ultimate': 35000,
+    'simple': 30000, 'easy': 28000, 'quick': 25000, 'step': 22000,
+    'effective': 20000, 'proven': 18000, 'examples': 16000, 'case': 15000,
+    'study': 14000, 'method': 13000, 'technique': 12000, 'approach': 11000,
+    'framework': 10000, 'process': 9500, 'system': 9000, 'hack': 8500,
+    'secret': 8000, 'trick': 7500, 'mistake': 7000, 'common': 6500,
+    'popular': 6000, 'trending': 5500, 'latest': 5000, 'new': 4800,
+    'updated': 4600, 'modern': 4400, 'profitable': 4200, 'money': 4000,
+    'entrepreneur': 3800, 'founder': 3600, 'indie': 3400, 'solo': 3200,
+    'small': 3000, 'website': 2800, 'blog': 2600, 'content': 2400,
+    'optimization': 2200, 'rank': 2000, 'ranking': 1800, 'google': 1600,
+    'search': 1400, 'traffic': 1200, 'conversion': 1000, 'funnel': 900,
+    'leads': 800, 'sales': 700, 'revenue': 600, 'profit': 500
+}.items()})
+
+def _parse_json(response):
+    """Decode a JSON response body, preferring orjson's C parser"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+class KeywordAPI:
+    """Free API integration for real keyword data"""
+    
+    def __init__(self):
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        })
+        # Keep connections to the API hosts alive and retry transient
+        # failures with backoff - saves a TCP/TLS handshake per call
+        adapter = HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(total=2, backoff_factor=0.3,
+                              status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # The fetchers run on executor threads, where Streamlit elements
+        # are silently dropped - record failed sources here so the caller
+        # can surface them once from the script thread
+        self.errors = []
+        # The fetchers are deterministic per keyword, so repeat lookups
+        # (Streamlit reruns re-ask constantly) skip the network entirely
+        self.get_google_suggestions = lru_cache(maxsize=512)(self._get_google_suggestions)
+        self.get_related_keywords_from_datamuse = lru_cache(maxsize=512)(self._get_related_keywords_from_datamuse)
+        self.get_wiki_related_terms = lru_cache(maxsize=512)(self._get_wiki_related_terms)
+        self.estimate_real_difficulty = lru_cache(maxsize=512)(self._estimate_real_difficulty)
+
+    def _get_google_suggestions(self, keyword):
+        """Get Google autocomplete suggestions for keyword"""
+        try:
+            url = "http://suggestqueries.google.com/complete/search"
+            params = {
+                'client': 'firefox',
+                'q': keyword,
+                'hl': 'en'
+            }
+            response = self.session.get(url, params=params, timeout=10)
+            if response.status_code == 200:
+                data = _parse_json(response)
+                if len(data) > 1 and isinstance(data[1], list):
+                    return [suggestion for suggestion in data[1] if suggestion and len(suggestion) > 2]
+            return []
+        except Exception:
+            log.warning("Google suggestions fetch failed", exc_info=True)
+            self.errors.append('Google Suggestions')
+            return []
+    
+    def _fetch_datamuse_words(self, params):
+        """Fetch one Datamuse query and return its word list"""
+        url = "https://api.datamuse.com/words"
+        response = self.session.get(url, params=params, timeout=10)
+        if response.status_code == 200:
+            return [item['word'] for item in _parse_json(response)]
+        return []
+
+    def _get_related_keywords_from_datamuse(self, keyword):
+        """Get related keywords from Datamuse API (free)"""
+        try:
+            # Similar meaning and words that often follow - two independent
+            # queries, fetched concurrently instead of back to back
+            queries = [
+                {'ml': keyword, 'max': 20},
+                {'rel_trg': keyword, 'max': 15}
+            ]
+            related_words = []
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                for words in executor.map(self._fetch_datamuse_words, queries):
+                    related_words.extend(words)
+
+            # Ordered dedup, stopping once we have the 25 we keep
+            seen = {}
+            for word in related_words:
+                seen.setdefault(word, None)
+                if len(seen) >= 25:
+                    break
+            return list(seen)
+
+        except Exception:
+            log.warning("Datamuse fetch failed", exc_info=True)
+            self.errors.append('Datamuse')
+            return []
+    
+    def _get_wiki_related_terms(self, keyword):
+        """Get related terms from Wikipedia API (free)"""
+        try:
+            # Search Wikipedia for the keyword
+            url = "https://en.wikipedia.org/api/rest_v1/page/summary/" + keyword.replace(' ', '_')
+            response = self.session.get(url, timeout=10)
+            
+            if response.status_code == 200:
+                data = _parse_json(response)
+                extract = data.get('extract', '')
+                
+                # Extract important terms from the summary, dropping filler
+                # words in one set comprehension against the precompiled
+                # module-level frozenset
+                words = _WIKI_WORD_RE.findall(extract.lower())
+                filtered_words = list({word for word in words if len(word) > 4 and word not in _WIKI_STOPWORDS})
+                return filtered_words[:15]
+            
+            return []
+            
+        except Exception:
+            log.warning("Wikipedia fetch failed", exc_info=True)
+            self.errors.append('Wikipedia')
+            return []
+    
+    def _estimate_real_difficulty(self, keyword):
+        """Estimate difficulty based on real search data"""
+        try:
+            # Use Google search to estimate competition
+            url = "https://www.google.com/search"
+            params = {
+                'q': f'"{keyword}"',  # Exact phrase search
+                'num': 1
+            }
+            
+            # Stream the SERP instead of buffering the full page - the
+            # result count appears near the top of the HTML, so we can
+            # usually stop after the first chunk or two. A small overlap
+            # carries over in case the match straddles a chunk boundary.
+            with self.session.get(url, params=params, timeout=10, stream=True) as response:
+                if response.status_code == 200:
+                    result_count = None
+                    buf = ''
+                    for chunk in response.iter_content(chunk_size=8192, decode_unicode=True):
+                        if not chunk:
+                            continue
+                        buf = buf[-128:] + chunk
+                        match = _RESULT_COUNT_RE.search(buf)
+                        if match:
+                            result_count = int(match.group(1).replace(',', ''))
+                            break
+
+                    if result_count is not None:
+                        # Convert to difficulty score (0-100)
+                        if result_count < 10000:
+                            return min(20, max(5, result_count / 500))  # Very easy
+                        elif result_count < 100000:
+                            return min(40, max(20, result_count / 2500))  # Easy
+                        elif result_count < 1000000:
+                            return min(60, max(40, result_count / 16667))  # Medium
+                        elif result_count < 10000000:
+                            return min(80, max(60, result_count / 125000))  # Hard
+                        else:
+                            return min(95, max(80, result_count / 1000000))  # Very hard
+            
+            # Fallback to heuristic scoring
+            words = keyword.lower().split()
+            word_count = len(words)
+            avg_length = sum(len(word) for word in words) / len(words) if words else 0
+            
+            # Base difficulty on length and word count
+            base_score = max(0, 50 - (word_count * 8) - (avg_length * 2))
+            return min(100, max(10, base_score))
+            
+        except Exception as e:
+            # Fallback to simple heuristic
+            words = keyword.lower().split()
+            word_count = len(words)
+            avg_length = sum(len(word) for word in words) / len(words) if words else 0
+            base_score = max(0, 50 - (word_count * 8) - (avg_length * 2))
+            return min(100, max(10, base_score))
+
+class SEOAnalyzer:
+    def __init__(self):
+        self.common_words = _COMMON_WORDS
+        self.stopwords = _STOPWORDS
+        self.word_frequencies = _WORD_FREQUENCIES
+        self.api = KeywordAPI()
+        # Memoize the pure scoring helpers per instance - main() asks for
+        # the same keywords' difficulty in three different tabs, and the
+        # similarity scorer is hit once per candidate against the same seed
+        self.estimate_keyword_difficulty = lru_cache(maxsize=2048)(self._estimate_keyword_difficulty)
+        self.calculate_similarity = lru_cache(maxsize=8192)(self._calculate_similarity)
+        
+    @st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+    def generate_related_keywords(_self, seed_keyword, max_keywords=20, use_api=True):
+        """Generate related keywords using both offline analysis and real API data
+
+        Cached on (seed, use_api) for an hour - the session-state guard in
+        main() only helps within one session, while this survives widget
+        churn and is shared across sessions in the same process.
+        """
+        seed_words = _self.clean_text(seed_keyword).split()
+        # An insertion-ordered dict doubles as the dedup set, so candidates
+        # keep a stable order all the way into the UI
+        related_keywords = {}
+
+        # Add seed keyword
+        related_keywords.setdefault(seed_keyword.lower(), None)
+        
+        # Get real data from APIs if enabled - the three sources are
+        # independent network calls, so fire them together and wait for
+        # the slowest instead of paying each timeout in sequence
+        if use_api:
+            try:
+                _self.api.errors.clear()
+                with ThreadPoolExecutor(max_workers=3) as executor:
+                    google_future = executor.submit(_self.api.get_google_suggestions, seed_keyword)
+                    datamuse_future = executor.submit(_self.api.get_related_keywords_from_datamuse, seed_keyword)
+                    wiki_future = executor.submit(_self.api.get_wiki_related_terms, seed_keyword)
+
+                    google_suggestions = google_future.result()
+                    datamuse_words = datamuse_future.result()
+                    wiki_terms = wiki_future.result()
+
+                # The fetchers swallow and log their own failures, since
+                # Streamlit elements rendered from worker threads are
+                # dropped - report them here on the script thread
+                if _self.api.errors:
+                    st.warning(f"{len(_self.api.errors)} data source(s) unavailable: {', '.join(_self.api.errors)}")
+
+                # Google autocomplete suggestions
+                related_keywords.update(dict.fromkeys(google_suggestions))
+
+                # Related words from Datamuse API
+                for word in datamuse_words:
+                    related_keywords.setdefault(f"{word} {seed_keyword}", None)
+                    related_keywords.setdefault(f"{seed_keyword} {word}", None)
+                    related_keywords.setdefault(word, None)
+
+                # Wikipedia related terms
+                for term in wiki_terms:
+                    related_keywords.setdefault(f"{term} {seed_keyword}", None)
+                    related_keywords.setdefault(f"{seed_keyword} {term}", None)
+
+            except Exception as e:
+                st.warning(f"API fetch error, using offline data: {str(e)}")
+        
+        # Generate combinations with common SEO words (offline backup).
+        # The full-phrase combinations don't depend on the individual seed
+        # words, so build them once instead of once per seed word, and cap
+        # the expansion - past ~10x the requested count extra candidates
+        # only add sorting work
+        keyword_cap = max_keywords * 10
+        for common_word in _self.common_words:
+            related_keywords.setdefault(f"{common_word} {seed_keyword}", None)
+            related_keywords.setdefault(f"{seed_keyword} {common_word}", None)
+
+        for word in seed_words:
+            if len(related_keywords) > keyword_cap:
+                break
+            for common_word in _self.common_words:
+                # Prefix and suffix combinations per seed word
+                related_keywords.setdefault(f"{common_word} {word}", None)
+                related_keywords.setdefault(f"{word} {common_word}", None)
+        
+        # Generate long-tail variations
+        long_tail_modifiers = [
+            "for beginners", "step by step", "in 2024", "complete guide",
+            "best practices", "case study", "examples", "tutorial",
+            "how to", "why you need", "mistakes to avoid", "tips and tricks",
+            "free", "online", "software", "tools", "strategy", "tips"
+        ]
+        
+        for modifier in long_tail_modifiers:
+            related_keywords.setdefault(f"{seed_keyword} {modifier}", None)
+            related_keywords.setdefault(f"{modifier} {seed_keyword}", None)
+        
+        # Score by relevance - lower the seed once so the memoized scorer
+        # sees one canonical key per pair, and keep only the top K with a
+        # bounded heap instead of sorting every candidate
+        seed_lower = seed_keyword.lower()
+        scored = (
+            (keyword, _self.calculate_similarity(seed_lower, keyword))
+            for keyword in related_keywords
+            if len(keyword.split()) <= 6 and len(keyword) >= 3
+        )
+        top = heapq.nlargest(max_keywords * 2, scored, key=lambda x: x[1])
+        return [kw[0] for kw in top]  # Return more keywords since we have better data
+    
+    def _calculate_similarity(self, text1, text2):
+        """Calculate token-overlap (Jaccard) similarity between two phrases"""
+        # O(tokens) set overlap instead of SequenceMatcher's character-level
+        # dynamic matching - and shared words are what keyword relevance
+        # actually means here
+        tokens1 = set(text1.lower().split())
+        tokens2 = set(text2.lower().split())
+        if not tokens1 or not tokens2:
+            return 0.0
+        return len(tokens1 & tokens2) / len(tokens1 | tokens2)
+    
+    def clean_text(self, text):
+        """Clean text for analysis"""
+        # Remove special characters and convert to lowercase
+        return _CLEAN_RE.sub('', text.lower())
+    
+    def _estimate_keyword_difficulty(self, keyword):
+        """Estimate keyword difficulty using heuristics"""
+        # Intern the tokens - the same short words recur across hundreds
+        # of candidates, and interned keys compare by pointer in the
+        # frequency-table lookups below
+        words = [sys.intern(w) for w in self.clean_text(keyword).split()]
+        
+        # Factors affecting difficulty
+        word_count = len(words)
+        avg_word_length = sum(len(word) for word in words) / len(words) if words else 0
+        
+        # Check word frequency - branch-free .get keeps the sum in one pass
+        freq = self.word_frequencies
+        total_frequency = sum(freq.get(word, 0) for word in words)
+        
+        # Calculate difficulty score (0-100)
+        # Higher frequency = higher difficulty
+        frequency_score = min(total_frequency / 10000, 50)  # Cap at 50
+        
+        # Longer phrases are generally easier
+        length_score = max(0, 30 - (word_count * 5))
+        
+        # Longer words are generally more specific (easier)
+        word_length_score = max(0, 20 - (avg_word_length * 2))
+        
+        difficulty = frequency_score + length_score + word_length_score
+        return min(max(difficulty, 0), 100)  # Clamp between 0-100
+
+    def estimate_keyword_difficulty_batch(self, keywords):
+        """Estimate difficulty for a whole keyword list at once
+
+        Same heuristics as the scalar version, but the three scores are
+        computed as NumPy array ops so scoring 15-30 keywords per rerun
+        stays in C instead of looping the interpreter per keyword.
+        """
+        freq = self.word_frequencies
+        token_lists = [self.clean_text(kw).split() for kw in keywords]
+        n = len(token_lists)
+
+        word_counts = np.fromiter((len(t) for t in token_lists), dtype=np.float64, count=n)
+        avg_lens = np.fromiter(
+            (sum(len(w) for w in t) / len(t) if t else 0.0 for t in token_lists),
+            dtype=np.float64, count=n
+        )
+        total_freqs = np.fromiter(
+            (sum(freq.get(w, 0) for w in t) for t in token_lists),
+            dtype=np.float64, count=n
+        )
+
+        frequency_score = np.minimum(total_freqs / 10000, 50)
+        length_score = np.maximum(0, 30 - word_counts * 5)
+        word_length_score = np.maximum(0, 20 - avg_lens * 2)
+
+        return np.clip(frequency_score + length_score + word_length_score, 0, 100)
+    
+    def suggest_blog_structure(self, keyword, related_keywords):
+        """Suggest blog post structure based on keyword analysis"""
+        structure = {
+            'title_suggestions': [],
+            'headings': [],
+            'meta_description': '',
+            'keyword_density': 0.015,  # 1.5%
+            'word_count_target': 1500
+        }
+        
+        # Title suggestions
+        title_templates = [
+            f"The Ultimate Guide to {keyword.title()}",
+            f"How to {keyword.title()}: Complete Tutorial",
+            f"{keyword.title()}: Best Practices and Tips",
+            f"Everything You Need to Know About {keyword.title()}",
+            f"{keyword.title()} for Beginners: Step-by-Step Guide"
+        ]
+        structure['title_suggestions'] = title_templates
+        
+        # Heading structure
+        headings = [
+            f"What is {keyword.title()}?",
+            f"Why {keyword.title()} Matters",
+            f"How to Get Started with {keyword.title()}",
+            f"Best Practices for {keyword.title()}",
+            f"Common Mistakes to Avoid",
+            f"Tools and Resources",
+            f"Case Studies and Examples",
+            f"Conclusion"
+        ]
+        structure['headings'] = headings
+        
+        # Meta description
+        structure['meta_description'] = f"Learn everything about {keyword} with our comprehensive guide. Discover best practices, tips, and strategies to master {keyword} today."
+        
+        return structure
+    
+    def generate_seo_checklist(self, keyword, title, meta_description):
+        """Generate on-page SEO checklist"""
+        checklist = {
+            'title_tag': [],
+            'meta_description': [],
+            'headings': [],
+            'content': [],
+            'technical': [],
+            'url': []
+        }
+        
+        # Title tag checks
+        title_length = len(title)
+        checklist['title_tag'].append(f"✓ Title length: {title_length} characters (ideal: 50-60)")
+        if keyword.lower() in title.lower():
+            checklist['title_tag'].append("✓ Primary keyword included in title")
+        else:
+            checklist['title_tag'].append("✗ Include primary keyword in title")
+        
+        # Meta description checks
+        meta_length = len(meta_description)
+        checklist['meta_description'].append(f"✓ Meta description length: {meta_length} characters (ideal: 150-160)")
+        if keyword.lower() in meta_description.lower():
+            checklist['meta_description'].append("✓ Primary keyword included in meta description")
+        else:
+            checklist['meta_description'].append("✗ Include primary keyword in meta description")
+        
+        # Heading checks
+        checklist['headings'].extend([
+            "✓ Use H1 for main title",
+            "✓ Include keyword in H1",
+            "✓ Use H2 for main sections",
+            "✓ Use H3 for subsections",
+            "✓ Include related keywords in headings"
+        ])
+        
+        # Content checks
+        checklist['content'].extend([
+            "✓ Keyword density: 1-2% of total content",
+            "✓ Include keyword in first paragraph",
+            "✓ Use related keywords naturally",
+            "✓ Add internal links to relevant pages",
+            "✓ Include external links to authoritative sources",
+            "✓ Add alt text to all images",
+            "✓ Use bullet points and numbered lists",
+            "✓ Keep paragraphs short (2-3 sentences)"
+        ])
+        
+        # Technical checks
+        checklist['technical'].extend([
+            "✓ Page loads in under 3 seconds",
+            "✓ Mobile-responsive design",
+            "✓ HTTPS enabled",
+            "✓ Proper URL structure",
+            "✓ Schema markup implemented",
+            "✓ XML sitemap updated"
+        ])
+        
+        # URL checks
+        suggested_url = self.generate_url_slug(keyword)
+        checklist['url'].append(f"✓ Suggested URL: /{suggested_url}")
+        checklist['url'].extend([
+            "✓ Include primary keyword in URL",
+            "✓ Use hyphens to separate words",
+            "✓ Keep URL under 60 characters",
+            "✓ Avoid special characters and numbers"
+        ])
+        
+        return checklist
+    
+    def generate_url_slug(self, keyword):
+        """Generate URL slug from keyword"""
+        # The deletion table only covers ASCII, so drop non-ASCII first -
+        # accented characters must not leak into the slug; translate then
+        # strips the invalid characters in one pass and split/join
+        # collapses whitespace runs to single hyphens without the regex
+        ascii_keyword = keyword.lower().encode('ascii', 'ignore').decode()
+        return '-'.join(ascii_keyword.translate(_SLUG_STRIP_TABLE).split())
+    
+    def preview_serp_snippet(self, title, meta_description, url):
+        """Generate SERP snippet preview"""
+        # Truncate title if too long
+        display_title = title[:60] + "..." if len(title) > 60 else title
+        
+        # Truncate meta description if too long
+        display_meta = meta_description[:160] + "..." if len(meta_description) > 160 else meta_description
+        
+        return {
+            'title': display_title,
+            'url': url,
+            'meta_description': display_meta,
+            'title_length': len(title),
+            'meta_length': len(meta_description)
+        }
+
+def _keyword_rows(keywords, difficulties):
+    """Format a keyword column as one markdown block with difficulty badges"""
+    return "\n\n".join(
+        f"{'🟢' if d < 30 else '🟡' if d < 70 else '🔴'} **{kw}** (Difficulty: {d:.0f})"
+        for kw, d in zip(keywords, difficulties)
+    )
+
+def main():
+    # Initialize SEO analyzer
+    if 'seo_analyzer' not in st.session_state:
+        st.session_state.seo_analyzer = SEOAnalyzer()
+    
+    seo_analyzer = st.session_state.seo_analyzer
+    
+    # Header
+    st.title("📈 RankBuddy")
+    st.markdown("*Your AI-free SEO companion for indie hackers and solo founders*")
+    
+    # Sidebar
+    st.sidebar.header("🎯 SEO Research")
+    
+    # API Toggle
+    use_apis = st.sidebar.checkbox(
+        "🌐 Use Free APIs for Real Data",
+        value=True,
+        help="Enable to get real keyword suggestions from Google, Datamuse, and Wikipedia APIs (free)"
+    )
+    
+    if use_apis:
+        st.sidebar.success("✅ Real-time keyword data enabled")
+        st.sidebar.markdown("**Data Sources:**")
+        st.sidebar.markdown("• Google Autocomplete")
+        st.sidebar.markdown("• Datamuse API")
+        st.sidebar.markdown("• Wikipedia API")
+    else:
+        st.sidebar.info("📴 Using offline data only")
+    
+    # Main input
+    seed_keyword = st.sidebar.text_input(
+        "Enter your seed keyword/topic:",
+        placeholder="e.g., content marketing for startups",
+        help="Enter the main topic you want to write about"
+    )
+    
+    if seed_keyword:
+        # Store data in session state
+        if 'current_keyword' not in st.session_state or st.session_state.current_keyword != seed_keyword or st.session_state.get('use_apis', True) != use_apis:
+            st.session_state.current_keyword = seed_keyword
+            st.session_state.use_apis = use_apis
+            
+            # Show loading message when using APIs
+            if use_apis:
+                with st.spinner('🔍 Fetching real keyword data from APIs...'):
+                    st.session_state.related_keywords = seo_analyzer.generate_related_keywords(seed_keyword, use_api=use_apis)
+            else:
+                st.session_state.related_keywords = seo_analyzer.generate_related_keywords(seed_keyword, use_api=use_apis)
+            
+            st.session_state.blog_structure = seo_analyzer.suggest_blog_structure(seed_keyword, st.session_state.related_keywords)
+        
+        # Tabs for different features
+        tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+            "🔍 Keywords", "📊 Analysis", "📝 Structure", "✅ SEO Checklist", "👀 SERP Preview", "📄 Export"
+        ])
+        
+        with tab1:
+            st.header("Keyword Research")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.subheader("Related Keywords")
+                top_keywords = st.session_state.related_keywords[:10]
+                st.markdown(_keyword_rows(
+                    top_keywords,
+                    seo_analyzer.estimate_keyword_difficulty_batch(top_keywords)
+                ))
+
+            with col2:
+                st.subheader("Long-tail Variations")
+                long_tail = [kw for kw in st.session_state.related_keywords if len(kw.split()) > 3][:10]
+                st.markdown(_keyword_rows(
+                    long_tail,
+                    seo_analyzer.estimate_keyword_difficulty_batch(long_tail)
+                ))
+        
+        with tab2:
+            st.header("Keyword Analysis")
+            
+            # Difficulty analysis - one vectorized call for the whole list
+            difficulties = seo_analyzer.estimate_keyword_difficulty_batch(st.session_state.related_keywords[:15])
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.subheader("Difficulty Distribution")
+                # Bin with NumPy and draw with Streamlit's native bar chart -
+                # no matplotlib figure construction on every tab switch
+                counts, edges = np.histogram(difficulties, bins=10)
+                hist_df = pd.DataFrame({
+                    'Difficulty Score': (edges[:-1] + edges[1:]) / 2,
+                    'Number of Keywords': counts
+                })
+                st.bar_chart(hist_df, x='Difficulty Score', y='Number of Keywords')
+            
+            with col2:
+                st.subheader("Keyword Metrics")
+                avg_difficulty = np.mean(difficulties)
+                st.metric("Average Difficulty", f"{avg_difficulty:.1f}")
+                
+                easy_keywords = sum(1 for d in difficulties if d < 30)
+                st.metric("Easy Keywords", f"{easy_keywords}")
+                
+                hard_keywords = sum(1 for d in difficulties if d > 70)
+                st.metric("Hard Keywords", f"{hard_keywords}")
+        
+        with tab3:
+            st.header("Blog Post Structure")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.subheader("Title Suggestions")
+                for i, title in enumerate(st.session_state.blog_structure['title_suggestions']):
+                    st.write(f"**{i+1}.** {title}")
+                
+                st.subheader("Content Guidelines")
+                st.write(f"**Target word count:** {st.session_state.blog_structure['word_count_target']:,} words")
+                st.write(f"**Keyword density:** {st.session_state.blog_structure['keyword_density']:.1%}")
+                
+                keyword_count = int(st.session_state.blog_structure['word_count_target'] * st.session_state.blog_structure['keyword_density'])
+                st.write(f"**Target keyword mentions:** {keyword_count} times")
+            
+            with col2:
+                st.subheader("Suggested Headings")
+                for i, heading in enumerate(st.session_state.blog_structure['headings']):
+                    level = "H2" if i == 0 else "H3"
+                    st.write(f"**{level}:** {heading}")
+                
+                st.subheader("Meta Description")
+                st.info(st.session_state.blog_structure['meta_description'])
+        
+        with tab4:
+            st.header("SEO Checklist")
+            
+            # Get user inputs for checklist
+            user_title = st.text_input("Your blog post title:", value=st.session_state.blog_structure['title_suggestions'][0])
+            user_meta = st.text_area("Your meta description:", value=st.session_state.blog_structure['meta_description'])
+            
+            if user_title and user_meta:
+                checklist = seo_analyzer.generate_seo_checklist(seed_keyword, user_title, user_meta)
+                
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    st.subheader("Title & Meta")
+                    for item in checklist['title_tag']:
+                        st.write(item)
+                    st.write("")
+                    for item in checklist['meta_description']:
+                        st.write(item)
+                    
+                    st.subheader("Headings")
+                    for item in checklist['headings']:
+                        st.write(item)
+                
+                with col2:
+                    st.subheader("Content")
+                    for item in checklist['content']:
+                        st.write(item)
+                    
+                    st.subheader("Technical")
+                    for item in checklist['technical']:
+                        st.write(item)
+                    
+                    st.subheader("URL")
+                    for item in checklist['url']:
+                        st.write(item)
+        
+        with tab5:
+            st.header("SERP Preview")
+            
+            # User inputs
+            preview_title = st.text_input("Title:", value=st.session_state.blog_structure['title_suggestions'][0])
+            preview_meta = st.text_area("Meta Description:", value=st.session_state.blog_structure['meta_description'])
+            preview_url = st.text_input("URL:", value=f"https://yourblog.com/{seo_analyzer.generate_url_slug(seed_keyword)}")
+            
+            if preview_title and preview_meta and preview_url:
+                snippet = seo_analyzer.preview_serp_snippet(preview_title, preview_meta, preview_url)
+                
+                # SERP preview styling - escape the user-supplied strings
+                # before they go through unsafe_allow_html
+                st.markdown(_SERP_TMPL.format(
+                    title=html.escape(snippet['title']),
+                    url=html.escape(snippet['url']),
+                    meta_description=html.escape(snippet['meta_description'])
+                ), unsafe_allow_html=True)
+                
+                # Length warnings
+                col1, col2 = st.columns(2)
+                with col1:
+                    title_status = "✅" if 50 <= snippet['title_length'] <= 60 else "⚠️"
+                    st.write(f"{title_status} Title: {snippet['title_length']} characters")
+                
+                with col2:
+                    meta_status = "✅" if 150 <= snippet['meta_length'] <= 160 else "⚠️"
+                    st.write(f"{meta_status} Meta: {snippet['meta_length']} characters")
+        
+        with tab6:
+            st.header("Export SEO Research")
+            
+            export_format = st.selectbox("Choose export format:", ["Markdown", "Text"])
+            
+            if st.button("Generate Export"):
+                # Score the exported keywords once, in one batch, and hand
+                # the map to the export builders instead of letting them
+                # re-invoke the estimator per line
+                export_keywords = [seed_keyword] + st.session_state.related_keywords[:15]
+                difficulties = dict(zip(
+                    export_keywords,
+                    seo_analyzer.estimate_keyword_difficulty_batch(export_keywords)
+                ))
+
+                if export_format == "Markdown":
+                    content = generate_markdown_export(seed_keyword, st.session_state.related_keywords, 
+                                                     st.session_state.blog_structure, difficulties)
+                else:
+                    content = generate_text_export(seed_keyword, st.session_state.related_keywords,
+                                                 st.session_state.blog_structure, difficulties)
+                
+                st.download_button(
+                    label=f"Download {export_format} file",
+                    data=content,
+                    file_name=f"rankbuddy_seo_research_{seed_keyword.replace(' ', '_')}.{'md' if export_format == 'Markdown' else 'txt'}",
+                    mime="text/plain"
+                )
+                
+                st.code(content, language='markdown' if export_format == 'Markdown' else 'text')
+
+def generate_markdown_export(keyword, related_keywords, structure, difficulties):
+    """Generate Markdown export of SEO research"""
+    ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    # Collect fragments and join once - repeated += recopies the whole
+    # report for every appended line
+    parts = [f"""# SEO Research Report: {keyword.title()}
+
+Generated on: {ts}
+
+## Keywords Analysis
+
+### Primary Keyword
+**{keyword}** (Difficulty: {difficulties.get(keyword, 50):.0f})
+
+### Related Keywords
+"""]
+
+    for kw in related_keywords[:15]:
+        difficulty = difficulties.get(kw, 50)
+        parts.append(f"- **{kw}** (Difficulty: {difficulty:.0f})\n")
+
+    parts.append("""
+## Blog Post Structure
+
+### Title Suggestions
+""")
+
+    for i, title in enumerate(structure['title_suggestions']):
+        parts.append(f"{i+1}. {title}\n")
+
+    parts.append("""
+### Suggested Headings
+""")
+
+    for heading in structure['headings']:
+        parts.append(f"- {heading}\n")
+
+    parts.append(f"""
+### Meta Description
+{structure['meta_description']}
+
+### Content Guidelines
+- **Target word count:** {structure['word_count_target']:,} words
+- **Keyword density:** {structure['keyword_density']:.1%}
+- **Target keyword mentions:** {int(structure['word_count_target'] * structure['keyword_density'])} times
+
+## SEO Checklist
+
+### Title Tag
+- Include primary keyword in title
+- Keep title between 50-60 characters
+- Make it compelling and click-worthy
+
+### Meta Description
+- Include primary keyword
+- Keep between 150-160 characters
+- Write a compelling description that encourages clicks
+
+### Content Optimization
+- Use keyword in first paragraph
+- Maintain 1-2% keyword density
+- Include related keywords naturally
+- Add internal and external links
+- Use proper heading structure (H1, H2, H3)
+- Add alt text to all images
+
+### Technical SEO
+- Ensure fast page load speed
+- Mobile-responsive design
+- HTTPS enabled
+- Proper URL structure
+- Schema markup
+- XML sitemap updated
+
+---
+*Generated by RankBuddy - Your AI-free SEO companion*
+""")
+
+    return "".join(parts)
+
+def generate_text_export(keyword, related_keywords, structure, difficulties):
+    """Generate text export of SEO research"""
+    ts = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    parts = [f"""SEO RESEARCH REPORT: {keyword.upper()}
+
+Generated on: {ts}
+
+=== KEYWORDS ANALYSIS ===
+
+Primary Keyword: {keyword} (Difficulty: {difficulties.get(keyword, 50):.0f})
+
+Related Keywords:
+"""]
+
+    for kw in related_keywords[:15]:
+        difficulty = difficulties.get(kw, 50)
+        parts.append(f"- {kw} (Difficulty: {difficulty:.0f})\n")
+
+    parts.append("""
+=== BLOG POST STRUCTURE ===
+
+Title Suggestions:
+""")
+
+    for i, title in enumerate(structure['title_suggestions']):
+        parts.append(f"{i+1}. {title}\n")
+
+    parts.append("""
+Suggested Headings:
+""")
+
+    for heading in structure['headings']:
+        parts.append(f"- {heading}\n")
+
+    parts.append(f"""
+Meta Description:
+{structure['meta_description']}
+
+Content Guidelines:
+- Target word count: {structure['word_count_target']:,} words
+- Keyword density: {structure['keyword_density']:.1%}
+- Target keyword mentions: {int(structure['word_count_target'] * structure['keyword_density'])} times
+
+=== SEO CHECKLIST ===
+
+Title Tag:
+- Include primary keyword in title
+- Keep title between 50-60 characters
+- Make it compelling and click-worthy
+
+Meta Description:
+- Include primary keyword
+- Keep between 150-160 characters
+- Write a compelling description that encourages clicks
+
+Content Optimization:
+- Use keyword in first paragraph
+- Maintain 1-2% keyword density
+- Include related keywords naturally
+- Add internal and external links
+- Use proper heading structure (H1, H2, H3)
+- Add alt text to all images
+
+Technical SEO:
+- Ensure fast page load speed
+- Mobile-responsive design
+- HTTPS enabled
+- Proper URL structure
+- Schema markup
+- XML sitemap updated
+
+---
+Generated by RankBuddy - Your AI-free SEO companion
+""")
+
+    return "".join(parts)
+
+if __name__ == "__main__":
+    main()
@@ -1,567 +1,699 @@
-import streamlit as st
-import numpy as np
-import matplotlib.pyplot as plt
-import requests
-import re
-import json
-from datetime import datetime
-from urllib.parse import quote_plus
-import time
-
-# Set page config
-st.set_page_config(
-    page_title="RankBuddy - Real-time SEO Optimizer",
-    page_icon="📈",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-class RealTimeKeywordAPI:
-    """Real-time keyword data from free APIs only"""
-    
-    def __init__(self):
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
-    
-    def get_google_autocomplete(self, keyword):
-        """Get real Google autocomplete suggestions"""
-        suggestions = []
-        try:
-            # Google Suggest API
-            url = "http://suggestqueries.google.com/complete/search"
-            params = {
-                'client': 'firefox',
-                'q': keyword,
-                'hl': 'en'
-            }
-            
-            response = self.session.get(url, params=params, timeout=15)
-            if response.status_code == 200:
-                data = response.json()
-                if len(data) > 1 and data[1]:
-                    suggestions = [s for s in data[1] if s and s != keyword]
-            
-            return suggestions[:20]
-            
-        except Exception as e:
-            st.error(f"Google Autocomplete API error: {str(e)}")
-            return []
-    
-    def get_google_related_searches(self, keyword):
-        """Get related searches using different variations"""
-        related = []
-        try:
-            # Try different keyword variations for more suggestions
-            variations = [
-                f"how to {keyword}",
-                f"what is {keyword}",
-                f"best {keyword}",
-                f"{keyword} guide",
-                f"{keyword} tutorial",
-                f"{keyword} tips",
-                f"{keyword} examples",
-                f"{keyword} tools",
-                f"{keyword} free",
-                f"{keyword} 2024"
-            ]
-            
-            for variation in variations:
-                try:
-                    url = "http://suggestqueries.google.com/complete/search"
-                    params = {
-                        'client': 'firefox',
-                        'q': variation,
-                        'hl': 'en'
-                    }
-                    
-                    response = self.session.get(url, params=params, timeout=10)
-                    if response.status_code == 200:
-                        data = response.json()
-                        if len(data) > 1 and data[1]:
-                            related.extend([s for s in data[1] if s and keyword.lower() in s.lower()])
-                    
-                    time.sleep(0.1)  # Be respectful to the API
-                except:
-                    continue
-            
-            return list(set(related))[:30]
-            
-        except Exception as e:
-            st.error(f"Related searches API error: {str(e)}")
-            return []
-    
-    def get_datamuse_related(self, keyword):
-        """Get semantically related words from Datamuse API"""
-        related_words = []
-        try:
-            # Get words with similar meaning
-            url = "https://api.datamuse.com/words"
-            
-            # Similar meaning
-            params = {'ml': keyword, 'max': 20}
-            response = self.session.get(url, params=params, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                related_words.extend([item['word'] for item in data if 'word' in item])
-            
-            # Words that often follow
-            params = {'lc': keyword, 'max': 15}
-            response = self.session.get(url, params=params, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                related_words.extend([item['word'] for item in data if 'word' in item])
-            
-            # Words that often precede
-            params = {'rc': keyword, 'max': 15}
-            response = self.session.get(url, params=params, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                related_words.extend([item['word'] for item in data if 'word' in item])
-            
-            return list(set(related_words))[:25]
-            
-        except Exception as e:
-            st.error(f"Datamuse API error: {str(e)}")
-            return []
-    
-    def get_wikipedia_terms(self, keyword):
-        """Get related terms from Wikipedia"""
-        related_terms = []
-        try:
-            # Search Wikipedia
-            search_url = "https://en.wikipedia.org/api/rest_v1/page/summary/" + quote_plus(keyword)
-            response = self.session.get(search_url, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                extract = data.get('extract', '')
-                
-                # Extract meaningful terms from the text
-                words = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', extract)
-                # Filter out common words and get unique terms
-                common_words = {'The', 'This', 'That', 'These', 'Those', 'And', 'But', 'Or', 'If', 'When', 'Where', 'How', 'What', 'Why', 'Who', 'Which'}
-                related_terms = [word for word in set(words) if word not in common_words and len(word) > 3]
-            
-            # Also try Wikipedia search API
-            search_api_url = "https://en.wikipedia.org/w/api.php"
-            params = {
-                'action': 'query',
-                'format': 'json',
-                'list': 'search',
-                'srsearch': keyword,
-                'srlimit': 10
-            }
-            
-            response = self.session.get(search_api_url, params=params, timeout=10)
-            if response.status_code == 200:
-                data = response.json()
-                if 'query' in data and 'search' in data['query']:
-                    titles = [item['title'] for item in data['query']['search']]
-                    related_terms.extend(titles)
-            
-            return list(set(related_terms))[:20]
-            
-        except Exception as e:
-            st.error(f"Wikipedia API error: {str(e)}")
-            return []
-    
-    def estimate_keyword_difficulty(self, keyword):
-        """Estimate difficulty based on search volume indicators"""
-        try:
-            # Simple heuristic based on keyword characteristics
-            words = keyword.lower().split()
-            word_count = len(words)
-            avg_length = sum(len(word) for word in words) / len(words) if words else 0
-            
-            # Longer, more specific keywords are generally easier
-            base_difficulty = max(10, 80 - (word_count * 15) - (avg_length * 2))
-            
-            # Adjust based on common high-competition terms
-            high_competition_terms = ['best', 'top', 'free', 'review', 'buy', 'cheap', 'price']
-            competition_boost = sum(5 for term in high_competition_terms if term in keyword.lower())
-            
-            difficulty = min(95, base_difficulty + competition_boost)
-            return difficulty
-            
-        except:
-            return 50  # Default medium difficulty
-
-class RealTimeSEOAnalyzer:
-    """SEO analysis using only real-time API data"""
-    
-    def __init__(self):
-        self.api = RealTimeKeywordAPI()
-    
-    def generate_real_keywords(self, seed_keyword):
-        """Generate keywords using only real API data"""
-        all_keywords = set()
-        all_keywords.add(seed_keyword.lower())
-        
-        # Get Google autocomplete suggestions
-        st.info("🔍 Fetching Google autocomplete suggestions...")
-        google_suggestions = self.api.get_google_autocomplete(seed_keyword)
-        all_keywords.update(google_suggestions)
-        
-        # Get Google related searches
-        st.info("🔍 Fetching Google related searches...")
-        google_related = self.api.get_google_related_searches(seed_keyword)
-        all_keywords.update(google_related)
-        
-        # Get Datamuse related words
-        st.info("🔍 Fetching semantic word relationships...")
-        datamuse_words = self.api.get_datamuse_related(seed_keyword)
-        # Create keyword combinations with Datamuse words
-        for word in datamuse_words:
-            all_keywords.add(f"{word} {seed_keyword}")
-            all_keywords.add(f"{seed_keyword} {word}")
-        
-        # Get Wikipedia related terms
-        st.info("🔍 Fetching Wikipedia related terms...")
-        wiki_terms = self.api.get_wikipedia_terms(seed_keyword)
-        for term in wiki_terms:
-            if len(term.split()) <= 3:  # Only short terms
-                all_keywords.add(f"{term.lower()} {seed_keyword}")
-                all_keywords.add(f"{seed_keyword} {term.lower()}")
-        
-        # Filter and clean keywords
-        filtered_keywords = []
-        for keyword in all_keywords:
-            if 3 <= len(keyword) <= 100 and len(keyword.split()) <= 6:
-                filtered_keywords.append(keyword.strip().lower())
-        
-        return list(set(filtered_keywords))[:50]  # Return top 50 unique keywords
-    
-    def categorize_keywords(self, keywords):
-        """Categorize keywords into short-tail and long-tail"""
-        short_tail = []
-        long_tail = []
-        
-        for keyword in keywords:
-            word_count = len(keyword.split())
-            if word_count <= 2:
-                short_tail.append(keyword)
-            else:
-                long_tail.append(keyword)
-        
-        return short_tail, long_tail
-    
-    def analyze_keyword_difficulty(self, keywords):
-        """Analyze difficulty for all keywords"""
-        difficulties = {}
-        for keyword in keywords:
-            difficulties[keyword] = self.api.estimate_keyword_difficulty(keyword)
-        return difficulties
-    
-    def suggest_content_structure(self, keyword, related_keywords):
-        """Suggest content structure based on real keyword data"""
-        structure = {
-            'titles': [
-                f"Complete Guide to {keyword.title()}",
-                f"How to Master {keyword.title()}: Expert Tips",
-                f"{keyword.title()}: Everything You Need to Know",
-                f"Ultimate {keyword.title()} Tutorial for Beginners",
-                f"Advanced {keyword.title()}: Best Practices"
-            ],
-            'headings': [
-                f"What is {keyword.title()}?",
-                f"Why {keyword.title()} Matters in 2024",
-                f"Getting Started with {keyword.title()}",
-                f"Advanced {keyword.title()} Strategies",
-                f"Common {keyword.title()} Mistakes to Avoid",
-                f"Best {keyword.title()} Tools and Resources",
-                f"Real-World {keyword.title()} Examples",
-                f"{keyword.title()} Future Trends"
-            ],
-            'meta_description': f"Master {keyword} with our comprehensive guide. Learn proven strategies, avoid common mistakes, and get expert tips for success.",
-            'target_length': 2000,
-            'keyword_density': 1.5
-        }
-        
-        return structure
-
-def main():
-    # Initialize analyzer
-    if 'analyzer' not in st.session_state:
-        st.session_state.analyzer = RealTimeSEOAnalyzer()
-    
-    analyzer = st.session_state.analyzer
-    
-    # Header
-    st.title("📈 RankBuddy - Real-Time SEO")
-    st.markdown("*Powered by real-time keyword data from Google, Datamuse & Wikipedia APIs*")
-    
-    # Sidebar
-    st.sidebar.header("🎯 Real-Time Keyword Research")
-    st.sidebar.success("✅ Using live API data only")
-    st.sidebar.markdown("**Data Sources:**")
-    st.sidebar.markdown("• Google Autocomplete API")
-    st.sidebar.markdown("• Google Related Searches")
-    st.sidebar.markdown("• Datamuse Semantic API")
-    st.sidebar.markdown("• Wikipedia Search API")
-    
-    # Main input
-    seed_keyword = st.sidebar.text_input(
-        "Enter your target keyword:",
-        placeholder="e.g., digital marketing",
-        help="Enter the keyword you want to rank for"
-    )
-    
-    if seed_keyword:
-        # Generate keywords with real-time progress
-        if 'current_keyword' not in st.session_state or st.session_state.current_keyword != seed_keyword:
-            st.session_state.current_keyword = seed_keyword
-            
-            with st.spinner('🌐 Fetching real-time keyword data...'):
-                # Generate keywords
-                st.session_state.all_keywords = analyzer.generate_real_keywords(seed_keyword)
-                
-                # Categorize keywords
-                short_tail, long_tail = analyzer.categorize_keywords(st.session_state.all_keywords)
-                st.session_state.short_tail = short_tail
-                st.session_state.long_tail = long_tail
-                
-                # Analyze difficulties
-                st.session_state.difficulties = analyzer.analyze_keyword_difficulty(st.session_state.all_keywords)
-                
-                # Generate content structure
-                st.session_state.structure = analyzer.suggest_content_structure(seed_keyword, st.session_state.all_keywords)
-        
-        # Tabs
-        tab1, tab2, tab3, tab4, tab5 = st.tabs([
-            "🔍 Keywords", "📊 Analysis", "📝 Content", "👀 SERP Preview", "📄 Export"
-        ])
-        
-        with tab1:
-            st.header("Real-Time Keyword Research")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.subheader("Short-Tail Keywords")
-                st.caption(f"Found {len(st.session_state.short_tail)} short-tail keywords")
-                
-                for keyword in st.session_state.short_tail[:15]:
-                    difficulty = st.session_state.difficulties.get(keyword, 50)
-                    color = "🟢" if difficulty < 30 else "🟡" if difficulty < 70 else "🔴"
-                    st.write(f"{color} **{keyword}** (Difficulty: {difficulty:.0f})")
-            
-            with col2:
-                st.subheader("Long-Tail Keywords")
-                st.caption(f"Found {len(st.session_state.long_tail)} long-tail keywords")
-                
-                for keyword in st.session_state.long_tail[:15]:
-                    difficulty = st.session_state.difficulties.get(keyword, 50)
-                    color = "🟢" if difficulty < 30 else "🟡" if difficulty < 70 else "🔴"
-                    st.write(f"{color} **{keyword}** (Difficulty: {difficulty:.0f})")
-        
-        with tab2:
-            st.header("Keyword Analysis")
-            
-            # Get difficulty values
-            all_difficulties = list(st.session_state.difficulties.values())
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                # Difficulty distribution chart
-                st.subheader("Difficulty Distribution")
-                fig, ax = plt.subplots(figsize=(10, 6))
-                ax.hist(all_difficulties, bins=15, color='skyblue', alpha=0.7, edgecolor='black')
-                ax.set_xlabel('Difficulty Score')
-                ax.set_ylabel('Number of Keywords')
-                ax.set_title('Real-Time Keyword Difficulty Analysis')
-                st.pyplot(fig)
-            
-            with col2:
-                st.subheader("Live Metrics")
-                
-                avg_difficulty = np.mean(all_difficulties)
-                st.metric("Average Difficulty", f"{avg_difficulty:.1f}")
-                
-                easy_count = sum(1 for d in all_difficulties if d < 30)
-                st.metric("Easy Keywords", easy_count)
-                
-                medium_count = sum(1 for d in all_difficulties if 30 <= d < 70)
-                st.metric("Medium Keywords", medium_count)
-                
-                hard_count = sum(1 for d in all_difficulties if d >= 70)
-                st.metric("Hard Keywords", hard_count)
-                
-                st.subheader("Recommendations")
-                if easy_count > 5:
-                    st.success("✅ Great! You have many easy keywords to target.")
-                elif medium_count > easy_count:
-                    st.warning("⚠️ Focus on medium difficulty keywords for quick wins.")
-                else:
-                    st.info("💡 Consider more specific long-tail variations.")
-        
-        with tab3:
-            st.header("Content Structure")
-            
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.subheader("Title Suggestions")
-                for i, title in enumerate(st.session_state.structure['titles']):
-                    st.write(f"**{i+1}.** {title}")
-                
-                st.subheader("Content Guidelines")
-                st.write(f"**Target Length:** {st.session_state.structure['target_length']:,} words")
-                st.write(f"**Keyword Density:** {st.session_state.structure['keyword_density']}%")
-                
-                keyword_mentions = int(st.session_state.structure['target_length'] * st.session_state.structure['keyword_density'] / 100)
-                st.write(f"**Target Mentions:** {keyword_mentions} times")
-            
-            with col2:
-                st.subheader("Suggested Headings")
-                for heading in st.session_state.structure['headings']:
-                    st.write(f"• {heading}")
-                
-                st.subheader("Meta Description")
-                st.info(st.session_state.structure['meta_description'])
-        
-        with tab4:
-            st.header("SERP Preview")
-            
-            selected_title = st.selectbox("Choose title:", st.session_state.structure['titles'])
-            custom_title = st.text_input("Or enter custom title:", value=selected_title)
-            
-            meta_desc = st.text_area("Meta description:", 
-                                   value=st.session_state.structure['meta_description'],
-                                   max_chars=160)
-            
-            url_slug = re.sub(r'[^a-z0-9]+', '-', seed_keyword.lower()).strip('-')
-            custom_url = st.text_input("URL:", value=f"https://yourblog.com/{url_slug}")
-            
-            # SERP Preview
-            title_display = custom_title[:60] + "..." if len(custom_title) > 60 else custom_title
-            meta_display = meta_desc[:160] + "..." if len(meta_desc) > 160 else meta_desc
-            
-            st.markdown(f"""
-            <div style="border: 1px solid #ddd; padding: 20px; border-radius: 8px; background: #f9f9f9;">
-                <h3 style="color: #1a0dab; margin: 0; font-size: 20px;">{title_display}</h3>
-                <p style="color: #006621; margin: 5px 0; font-size: 14px;">{custom_url}</p>
-                <p style="color: #545454; margin: 10px 0 0 0; font-size: 13px;">{meta_display}</p>
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Length indicators
-            col1, col2 = st.columns(2)
-            with col1:
-                title_status = "✅" if 50 <= len(custom_title) <= 60 else "⚠️"
-                st.write(f"{title_status} Title: {len(custom_title)} characters")
-            
-            with col2:
-                meta_status = "✅" if 150 <= len(meta_desc) <= 160 else "⚠️"
-                st.write(f"{meta_status} Meta: {len(meta_desc)} characters")
-        
-        with tab5:
-            st.header("Export Research")
-            
-            export_format = st.selectbox("Format:", ["Markdown", "Text", "JSON"])
-            
-            if st.button("Generate Export"):
-                timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-                
-                if export_format == "Markdown":
-                    content = f"""# Real-Time SEO Research: {seed_keyword.title()}
-
-Generated: {timestamp}
-
-## Keywords Found
-- **Total Keywords:** {len(st.session_state.all_keywords)}
-- **Short-tail:** {len(st.session_state.short_tail)}
-- **Long-tail:** {len(st.session_state.long_tail)}
-
-### Top Short-Tail Keywords
-"""
-                    for kw in st.session_state.short_tail[:10]:
-                        diff = st.session_state.difficulties.get(kw, 50)
-                        content += f"- **{kw}** (Difficulty: {diff:.0f})\n"
-                    
-                    content += "\n### Top Long-Tail Keywords\n"
-                    for kw in st.session_state.long_tail[:15]:
-                        diff = st.session_state.difficulties.get(kw, 50)
-                        content += f"- **{kw}** (Difficulty: {diff:.0f})\n"
-                    
-                    content += f"""
-## Content Strategy
-### Recommended Title
-{st.session_state.structure['titles'][0]}
-
-### Meta Description
-{st.session_state.structure['meta_description']}
-
-### Content Structure
-"""
-                    for heading in st.session_state.structure['headings']:
-                        content += f"- {heading}\n"
-                    
-                    content += f"""
-## SEO Guidelines
-- Target Length: {st.session_state.structure['target_length']:,} words
-- Keyword Density: {st.session_state.structure['keyword_density']}%
-- Focus on easy-difficulty keywords first
-- Use long-tail keywords in subheadings
-
----
-*Generated by RankBuddy Real-Time SEO Analyzer*
-"""
-                
-                elif export_format == "JSON":
-                    content = json.dumps({
-                        'keyword': seed_keyword,
-                        'timestamp': timestamp,
-                        'short_tail_keywords': st.session_state.short_tail,
-                        'long_tail_keywords': st.session_state.long_tail,
-                        'difficulties': st.session_state.difficulties,
-                        'content_structure': st.session_state.structure
-                    }, indent=2)
-                
-                else:  # Text format
-                    content = f"""REAL-TIME SEO RESEARCH: {seed_keyword.upper()}
-Generated: {timestamp}
-
-KEYWORDS FOUND:
-Total: {len(st.session_state.all_keywords)}
-Short-tail: {len(st.session_state.short_tail)}
-Long-tail: {len(st.session_state.long_tail)}
-
-TOP KEYWORDS:
-"""
-                    for kw in st.session_state.all_keywords[:20]:
-                        diff = st.session_state.difficulties.get(kw, 50)
-                        content += f"- {kw} (Difficulty: {diff:.0f})\n"
-                
-                st.download_button(
-                    label=f"Download {export_format}",
-                    data=content,
-                    file_name=f"rankbuddy_realtime_{seed_keyword.replace(' ', '_')}.{export_format.lower()}",
-                    mime="text/plain"
-                )
-                
-                st.code(content, language=export_format.lower())
-
-    else:
-        st.info("👆 Enter a keyword in the sidebar to start real-time analysis")
-        
-        # Show API status
-        st.subheader("🌐 API Status")
-        col1, col2, col3 = st.columns(3)
-        
-        with col1:
-            st.success("✅ Google Autocomplete")
-            st.caption("Real search suggestions")
-        
-        with col2:
-            st.success("✅ Datamuse API") 
-            st.caption("Semantic relationships")
-        
-        with col3:
-            st.success("✅ Wikipedia API")
-            st.caption("Related concepts")
-
-if __name__ == "__main__":
-    main()
+import streamlit as st
+import numpy as np
+import matplotlib.pyplot as plt
+import requests
+import httpx
+import asyncio
+import re
+import sys
+import orjson
+import io
+import logging
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from datetime import datetime
+
+# High-competition markers for the difficulty heuristic, built once.
+# Substring containment (not word matching) is deliberate - it keeps the
+# original scoring, where "buyers" and "prices" also count, and each
+# term boosts at most once per keyword
+_HIGH_COMPETITION_TERMS = frozenset({'best', 'top', 'free', 'review', 'buy', 'cheap', 'price'})
+
+# Title-case phrases in Wikipedia extracts, plus the words to ignore -
+# both built once at import instead of per call
+_TITLE_CASE_RE = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
+_COMMON_WORDS = frozenset({
+    'The', 'This', 'That', 'These', 'Those', 'And', 'But', 'Or', 'If',
+    'When', 'Where', 'How', 'What', 'Why', 'Who', 'Which'
+})
+
+# URL slug cleanup for the SERP preview tab
+_URL_SLUG_RE = re.compile(r'[^a-z0-9]+')
+
+log = logging.getLogger('rankbuddy')
+
+# Keywords are normalized once at ingestion (lowercased, interned) and
+# carried through the tabs and exports as records, so downstream code
+# reads precomputed word counts and difficulties instead of re-running
+# .lower()/.split() and dict lookups on every render
+KeywordRec = namedtuple('KeywordRec', 'text word_count difficulty')
+
+# Set page config
+st.set_page_config(
+    page_title="RankBuddy - Real-time SEO Optimizer",
+    page_icon="📈",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+@st.cache_data(show_spinner=False)
+def _difficulty_histogram(values):
+    """Render the difficulty histogram to PNG bytes, cached on the values
+
+    Reruns with unchanged difficulties (typing in the SERP preview,
+    switching export format) reuse the rendered image instead of paying
+    matplotlib's figure construction again. Closing the figure keeps the
+    cache from leaking figures across reruns.
+    """
+    fig, ax = plt.subplots(figsize=(10, 6))
+    ax.hist(values, bins=15, color='skyblue', alpha=0.7, edgecolor='black')
+    ax.set_xlabel('Difficulty Score')
+    ax.set_ylabel('Number of Keywords')
+    ax.set_title('Real-Time Keyword Difficulty Analysis')
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png')
+    plt.close(fig)
+    return buf.getvalue()
+
+class RealTimeKeywordAPI:
+    """Real-time keyword data from free APIs only"""
+    
+    def __init__(self):
+        self.session = requests.Session()
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            # Ask for compressed bodies explicitly - cuts bytes on the
+            # wire 3-5x for the text-heavy Wikipedia responses
+            'Accept-Encoding': 'gzip, deflate'
+        })
+        # Failed sources are collected here instead of calling st.error
+        # inside the fetchers - a repaint per failure is slow under rapid
+        # reruns, so the pipeline reports them once at the end
+        self.errors = []
+        # Streamlit reruns re-ask for the same seed constantly - the
+        # fetchers are deterministic per keyword, so memoize them and
+        # repeat lookups never touch the network
+        self.get_google_autocomplete = lru_cache(maxsize=256)(self._get_google_autocomplete)
+        self.get_google_related_searches = lru_cache(maxsize=256)(self._get_google_related_searches)
+        self.get_datamuse_related = lru_cache(maxsize=256)(self._get_datamuse_related)
+        self.get_wikipedia_terms = lru_cache(maxsize=256)(self._get_wikipedia_terms)
+        self.estimate_keyword_difficulty = lru_cache(maxsize=4096)(self._estimate_keyword_difficulty)
+    
+    def _get_google_autocomplete(self, keyword):
+        """Get real Google autocomplete suggestions"""
+        suggestions = []
+        try:
+            # Google Suggest API
+            url = "http://suggestqueries.google.com/complete/search"
+            params = {
+                'client': 'firefox',
+                'q': keyword,
+                'hl': 'en'
+            }
+            
+            response = self.session.get(url, params=params, timeout=15)
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                if len(data) > 1 and data[1]:
+                    suggestions = [s for s in data[1] if s and s != keyword]
+            
+            return suggestions[:20]
+            
+        except Exception:
+            log.warning("Google autocomplete fetch failed", exc_info=True)
+            self.errors.append('Google Autocomplete')
+            return []
+    
+    def _get_google_related_searches(self, keyword):
+        """Get related searches using different variations"""
+        related = []
+        try:
+            # Try different keyword variations for more suggestions
+            variations = [
+                f"how to {keyword}",
+                f"what is {keyword}",
+                f"best {keyword}",
+                f"{keyword} guide",
+                f"{keyword} tutorial",
+                f"{keyword} tips",
+                f"{keyword} examples",
+                f"{keyword} tools",
+                f"{keyword} free",
+                f"{keyword} 2024"
+            ]
+            
+            # The ten variation lookups are independent, so fan them out
+            # concurrently - wall clock drops from ten round trips (plus
+            # the old inter-request sleeps) to roughly one
+            url = "http://suggestqueries.google.com/complete/search"
+            keyword_lower = keyword.lower()
+
+            def fetch_variation(variation):
+                try:
+                    params = {
+                        'client': 'firefox',
+                        'q': variation,
+                        'hl': 'en'
+                    }
+                    response = self.session.get(url, params=params, timeout=10)
+                    if response.status_code == 200:
+                        data = orjson.loads(response.content)
+                        if len(data) > 1 and data[1]:
+                            return [s for s in data[1] if s and keyword_lower in s.lower()]
+                except:
+                    pass
+                return []
+
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                for suggestions in executor.map(fetch_variation, variations):
+                    related.extend(suggestions)
+
+            # dict.fromkeys dedups in one pass and keeps insertion order
+            # (guaranteed since 3.7), so the same seed always yields the
+            # same list - which keeps the cached pipeline hit rate high
+            return list(dict.fromkeys(related))[:30]
+            
+        except Exception:
+            log.warning("Google related searches fetch failed", exc_info=True)
+            self.errors.append('Google Related Searches')
+            return []
+    
+    async def _datamuse_all(self, keyword):
+        """Issue the three Datamuse queries concurrently over one HTTP/2 connection
+
+        Sequentially these cost a TLS handshake plus three round trips;
+        multiplexed on a single httpx connection they land in roughly one.
+        """
+        url = "https://api.datamuse.com/words"
+        async with httpx.AsyncClient(http2=True, timeout=10.0) as client:
+            return await asyncio.gather(
+                client.get(url, params={'ml': keyword, 'max': 20}),   # similar meaning
+                client.get(url, params={'lc': keyword, 'max': 15}),   # words that often follow
+                client.get(url, params={'rc': keyword, 'max': 15})    # words that often precede
+            )
+
+    def _get_datamuse_related(self, keyword):
+        """Get semantically related words from Datamuse API"""
+        related_words = []
+        try:
+            for response in asyncio.run(self._datamuse_all(keyword)):
+                if response.status_code == 200:
+                    data = orjson.loads(response.content)
+                    related_words.extend([item['word'] for item in data if 'word' in item])
+
+            return list(dict.fromkeys(related_words))[:25]
+
+        except Exception:
+            log.warning("Datamuse fetch failed", exc_info=True)
+            self.errors.append('Datamuse')
+            return []
+    
+    def _get_wikipedia_terms(self, keyword):
+        """Get related terms from Wikipedia"""
+        related_terms = []
+        try:
+            # One generator=search request returns the matching page
+            # titles together with their intro extracts - half the round
+            # trips of the old REST-summary-then-search sequence
+            search_api_url = "https://en.wikipedia.org/w/api.php"
+            params = {
+                'action': 'query',
+                'format': 'json',
+                'generator': 'search',
+                'gsrsearch': keyword,
+                'gsrlimit': 10,
+                'prop': 'extracts',
+                'exintro': 1,
+                'explaintext': 1
+            }
+
+            response = self.session.get(search_api_url, params=params, timeout=10)
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                for page in data.get('query', {}).get('pages', {}).values():
+                    related_terms.append(page['title'])
+                    # Extract meaningful terms from the intro text,
+                    # filtering out common words
+                    for word in _TITLE_CASE_RE.findall(page.get('extract', '')):
+                        if word not in _COMMON_WORDS and len(word) > 3:
+                            related_terms.append(word)
+
+            return list(dict.fromkeys(related_terms))[:20]
+            
+        except Exception:
+            log.warning("Wikipedia fetch failed", exc_info=True)
+            self.errors.append('Wikipedia')
+            return []
+    
+    def _estimate_keyword_difficulty(self, keyword):
+        """Estimate difficulty based on search volume indicators"""
+        try:
+            # Simple heuristic based on keyword characteristics
+            k_lower = keyword.lower()
+            words = k_lower.split()
+            word_count = len(words)
+            avg_length = sum(len(word) for word in words) / len(words) if words else 0
+
+            # Longer, more specific keywords are generally easier
+            base_difficulty = max(10, 80 - (word_count * 15) - (avg_length * 2))
+
+            # Adjust based on common high-competition terms
+            competition_boost = sum(5 for term in _HIGH_COMPETITION_TERMS if term in k_lower)
+            
+            difficulty = min(95, base_difficulty + competition_boost)
+            return difficulty
+            
+        except:
+            return 50  # Default medium difficulty
+
+class RealTimeSEOAnalyzer:
+    """SEO analysis using only real-time API data"""
+    
+    def __init__(self):
+        self.api = RealTimeKeywordAPI()
+    
+    def generate_real_keywords(self, seed_keyword):
+        """Generate keywords using only real API data"""
+        # Normalize, filter and dedup in one pass as candidates arrive -
+        # the dict keeps insertion order, so the final list is stable and
+        # no second filter/set/list pass is needed
+        keywords = {}
+        self.api.errors.clear()
+
+        def _add(candidate):
+            keyword = sys.intern(candidate.strip().lower())
+            if 3 <= len(keyword) <= 100 and keyword.count(' ') <= 5:
+                keywords.setdefault(keyword, None)
+
+        _add(seed_keyword)
+
+        # Fan the four sources out on worker threads and stream progress
+        # through st.status as each lands, instead of blocking the script
+        # thread on one fetch at a time behind st.info lines
+        fetchers = {
+            'Google autocomplete': self.api.get_google_autocomplete,
+            'Google related searches': self.api.get_google_related_searches,
+            'Datamuse relationships': self.api.get_datamuse_related,
+            'Wikipedia terms': self.api.get_wikipedia_terms
+        }
+        results = {}
+        with st.status("🌐 Fetching real-time keyword data...", expanded=True) as status:
+            with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+                futures = {executor.submit(fetch, seed_keyword): name
+                           for name, fetch in fetchers.items()}
+                for done, future in enumerate(as_completed(futures), 1):
+                    name = futures[future]
+                    results[name] = future.result()
+                    status.update(label=f"🔍 Fetched {name} ({done}/{len(fetchers)})")
+            status.update(label="✅ Keyword data fetched", state="complete", expanded=False)
+
+        for suggestion in results['Google autocomplete']:
+            _add(suggestion)
+
+        for suggestion in results['Google related searches']:
+            _add(suggestion)
+
+        # Create keyword combinations with Datamuse words
+        for word in results['Datamuse relationships']:
+            _add(f"{word} {seed_keyword}")
+            _add(f"{seed_keyword} {word}")
+
+        for term in results['Wikipedia terms']:
+            if term.count(' ') <= 2:  # Only short terms
+                _add(f"{term} {seed_keyword}")
+                _add(f"{seed_keyword} {term}")
+
+        # Surface upstream failures once at the boundary - the fetchers
+        # only log, so one flaky source never forces mid-fetch repaints
+        if self.api.errors:
+            st.warning(f"{len(self.api.errors)} data source(s) unavailable: {', '.join(self.api.errors)}")
+
+        return list(keywords)[:50]  # Return top 50 unique keywords
+    
+    def categorize_keywords(self, records):
+        """Categorize keyword records into short-tail and long-tail"""
+        short_tail = []
+        long_tail = []
+
+        for rec in records:
+            if rec.word_count <= 2:
+                short_tail.append(rec)
+            else:
+                long_tail.append(rec)
+
+        return short_tail, long_tail
+    
+    def analyze_keyword_difficulty(self, keywords):
+        """Analyze difficulty for all keywords in one vectorized pass
+
+        Same heuristics as the per-keyword estimator, but the base score,
+        clamp and competition boost run as NumPy array ops over the whole
+        batch instead of dispatching Python bytecode per keyword.
+        """
+        lowered = [kw.lower() for kw in keywords]
+        token_lists = [kw.split() for kw in lowered]
+        n = len(token_lists)
+
+        word_counts = np.fromiter((len(t) for t in token_lists), dtype=np.float32, count=n)
+        avg_lens = np.fromiter(
+            (sum(len(w) for w in t) / len(t) if t else 0.0 for t in token_lists),
+            dtype=np.float32, count=n
+        )
+        boosts = np.fromiter(
+            (sum(5 for term in _HIGH_COMPETITION_TERMS if term in kw) for kw in lowered),
+            dtype=np.float32, count=n
+        )
+
+        base = np.maximum(10, 80 - word_counts * 15 - avg_lens * 2)
+        difficulties = np.minimum(95, base + boosts)
+        return dict(zip(keywords, difficulties.tolist()))
+    
+    def suggest_content_structure(self, keyword, related_keywords):
+        """Suggest content structure based on real keyword data"""
+        structure = {
+            'titles': [
+                f"Complete Guide to {keyword.title()}",
+                f"How to Master {keyword.title()}: Expert Tips",
+                f"{keyword.title()}: Everything You Need to Know",
+                f"Ultimate {keyword.title()} Tutorial for Beginners",
+                f"Advanced {keyword.title()}: Best Practices"
+            ],
+            'headings': [
+                f"What is {keyword.title()}?",
+                f"Why {keyword.title()} Matters in 2024",
+                f"Getting Started with {keyword.title()}",
+                f"Advanced {keyword.title()} Strategies",
+                f"Common {keyword.title()} Mistakes to Avoid",
+                f"Best {keyword.title()} Tools and Resources",
+                f"Real-World {keyword.title()} Examples",
+                f"{keyword.title()} Future Trends"
+            ],
+            'meta_description': f"Master {keyword} with our comprehensive guide. Learn proven strategies, avoid common mistakes, and get expert tips for success.",
+            'target_length': 2000,
+            'keyword_density': 1.5
+        }
+        
+        return structure
+
+@lru_cache(maxsize=256)
+def _truncate(text, limit):
+    """Clip display text with an ellipsis, memoized across reruns"""
+    return text[:limit] + "..." if len(text) > limit else text
+
+@st.fragment
+def _serp_preview(titles, default_meta, seed_keyword):
+    """SERP preview subtree, isolated so typing only reruns this fragment
+
+    Every keystroke in the title/meta/URL inputs used to rerun the whole
+    script - all tabs, the histogram, the session-state checks. As a
+    fragment, only this function re-executes when its own widgets change.
+    """
+    selected_title = st.selectbox("Choose title:", titles)
+    custom_title = st.text_input("Or enter custom title:", value=selected_title)
+
+    meta_desc = st.text_area("Meta description:",
+                           value=default_meta,
+                           max_chars=160)
+
+    url_slug = _URL_SLUG_RE.sub('-', seed_keyword.lower()).strip('-')
+    custom_url = st.text_input("URL:", value=f"https://yourblog.com/{url_slug}")
+
+    # SERP Preview
+    title_display = _truncate(custom_title, 60)
+    meta_display = _truncate(meta_desc, 160)
+
+    st.markdown(f"""
+    <div style="border: 1px solid #ddd; padding: 20px; border-radius: 8px; background: #f9f9f9;">
+        <h3 style="color: #1a0dab; margin: 0; font-size: 20px;">{title_display}</h3>
+        <p style="color: #006621; margin: 5px 0; font-size: 14px;">{custom_url}</p>
+        <p style="color: #545454; margin: 10px 0 0 0; font-size: 13px;">{meta_display}</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Length indicators
+    col1, col2 = st.columns(2)
+    with col1:
+        title_status = "✅" if 50 <= len(custom_title) <= 60 else "⚠️"
+        st.write(f"{title_status} Title: {len(custom_title)} characters")
+
+    with col2:
+        meta_status = "✅" if 150 <= len(meta_desc) <= 160 else "⚠️"
+        st.write(f"{meta_status} Meta: {len(meta_desc)} characters")
+
+@st.cache_resource
+def _get_analyzer():
+    """One analyzer - and one HTTP session - shared across all sessions"""
+    return RealTimeSEOAnalyzer()
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _run_pipeline(seed_keyword):
+    """Run the full keyword pipeline for one seed, memoized by Streamlit
+
+    Session state only guards against reruns within one session; caching
+    the whole pipeline here means any rerun - or another browser session
+    asking for the same seed within the hour - skips all four API calls
+    and the difficulty pass entirely.
+    """
+    analyzer = _get_analyzer()
+    all_keywords = analyzer.generate_real_keywords(seed_keyword)
+    difficulties = analyzer.analyze_keyword_difficulty(all_keywords)
+    # Normalize into records here, once - downstream tabs and exports
+    # read word counts and difficulties as attributes instead of
+    # re-splitting strings and hashing into the difficulty dict
+    records = [KeywordRec(kw, len(kw.split()), difficulties[kw]) for kw in all_keywords]
+    short_tail, long_tail = analyzer.categorize_keywords(records)
+    structure = analyzer.suggest_content_structure(seed_keyword, all_keywords)
+    return records, short_tail, long_tail, difficulties, structure
+
+def main():
+    # Header
+    st.title("📈 RankBuddy - Real-Time SEO")
+    st.markdown("*Powered by real-time keyword data from Google, Datamuse & Wikipedia APIs*")
+    
+    # Sidebar
+    st.sidebar.header("🎯 Real-Time Keyword Research")
+    st.sidebar.success("✅ Using live API data only")
+    st.sidebar.markdown("**Data Sources:**")
+    st.sidebar.markdown("• Google Autocomplete API")
+    st.sidebar.markdown("• Google Related Searches")
+    st.sidebar.markdown("• Datamuse Semantic API")
+    st.sidebar.markdown("• Wikipedia Search API")
+    
+    # Main input
+    seed_keyword = st.sidebar.text_input(
+        "Enter your target keyword:",
+        placeholder="e.g., digital marketing",
+        help="Enter the keyword you want to rank for"
+    )
+    
+    if seed_keyword:
+        # The pipeline itself is cached, so this is a lookup on every
+        # rerun except the first for a given seed; the st.status block
+        # inside generate_real_keywords shows progress on cache misses
+        (st.session_state.all_keywords,
+         st.session_state.short_tail,
+         st.session_state.long_tail,
+         st.session_state.difficulties,
+         st.session_state.structure) = _run_pipeline(seed_keyword)
+
+        # Tabs
+        tab1, tab2, tab3, tab4, tab5 = st.tabs([
+            "🔍 Keywords", "📊 Analysis", "📝 Content", "👀 SERP Preview", "📄 Export"
+        ])
+        
+        with tab1:
+            st.header("Real-Time Keyword Research")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.subheader("Short-Tail Keywords")
+                st.caption(f"Found {len(st.session_state.short_tail)} short-tail keywords")
+                
+                for rec in st.session_state.short_tail[:15]:
+                    color = "🟢" if rec.difficulty < 30 else "🟡" if rec.difficulty < 70 else "🔴"
+                    st.write(f"{color} **{rec.text}** (Difficulty: {rec.difficulty:.0f})")
+
+            with col2:
+                st.subheader("Long-Tail Keywords")
+                st.caption(f"Found {len(st.session_state.long_tail)} long-tail keywords")
+
+                for rec in st.session_state.long_tail[:15]:
+                    color = "🟢" if rec.difficulty < 30 else "🟡" if rec.difficulty < 70 else "🔴"
+                    st.write(f"{color} **{rec.text}** (Difficulty: {rec.difficulty:.0f})")
+        
+        with tab2:
+            st.header("Keyword Analysis")
+            
+            # Get difficulty values as one contiguous array - the chart
+            # and all four metrics below read it without re-iterating the
+            # dict in Python
+            all_difficulties = np.fromiter(
+                st.session_state.difficulties.values(), dtype=np.float32
+            )
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                # Difficulty distribution chart
+                st.subheader("Difficulty Distribution")
+                st.image(_difficulty_histogram(tuple(all_difficulties.tolist())))
+            
+            with col2:
+                st.subheader("Live Metrics")
+                
+                avg_difficulty = all_difficulties.mean()
+                st.metric("Average Difficulty", f"{avg_difficulty:.1f}")
+
+                # Bucket counts as boolean-mask sums - three C-level
+                # passes instead of three Python generator loops
+                easy_count = int((all_difficulties < 30).sum())
+                st.metric("Easy Keywords", easy_count)
+
+                medium_count = int(((all_difficulties >= 30) & (all_difficulties < 70)).sum())
+                st.metric("Medium Keywords", medium_count)
+
+                hard_count = int((all_difficulties >= 70).sum())
+                st.metric("Hard Keywords", hard_count)
+                
+                st.subheader("Recommendations")
+                if easy_count > 5:
+                    st.success("✅ Great! You have many easy keywords to target.")
+                elif medium_count > easy_count:
+                    st.warning("⚠️ Focus on medium difficulty keywords for quick wins.")
+                else:
+                    st.info("💡 Consider more specific long-tail variations.")
+        
+        with tab3:
+            st.header("Content Structure")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.subheader("Title Suggestions")
+                for i, title in enumerate(st.session_state.structure['titles']):
+                    st.write(f"**{i+1}.** {title}")
+                
+                st.subheader("Content Guidelines")
+                st.write(f"**Target Length:** {st.session_state.structure['target_length']:,} words")
+                st.write(f"**Keyword Density:** {st.session_state.structure['keyword_density']}%")
+                
+                keyword_mentions = int(st.session_state.structure['target_length'] * st.session_state.structure['keyword_density'] / 100)
+                st.write(f"**Target Mentions:** {keyword_mentions} times")
+            
+            with col2:
+                st.subheader("Suggested Headings")
+                for heading in st.session_state.structure['headings']:
+                    st.write(f"• {heading}")
+                
+                st.subheader("Meta Description")
+                st.info(st.session_state.structure['meta_description'])
+        
+        with tab4:
+            st.header("SERP Preview")
+
+            _serp_preview(st.session_state.structure['titles'],
+                          st.session_state.structure['meta_description'],
+                          seed_keyword)
+        
+        with tab5:
+            st.header("Export Research")
+            
+            export_format = st.selectbox("Format:", ["Markdown", "Text", "JSON"])
+            
+            if st.button("Generate Export"):
+                timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                
+                if export_format == "Markdown":
+                    # Collect fragments and join once instead of recopying
+                    # the growing report with += per line
+                    parts = [f"""# Real-Time SEO Research: {seed_keyword.title()}
+
+Generated: {timestamp}
+
+## Keywords Found
+- **Total Keywords:** {len(st.session_state.all_keywords)}
+- **Short-tail:** {len(st.session_state.short_tail)}
+- **Long-tail:** {len(st.session_state.long_tail)}
+
+### Top Short-Tail Keywords
+"""]
+                    for rec in st.session_state.short_tail[:10]:
+                        parts.append(f"- **{rec.text}** (Difficulty: {rec.difficulty:.0f})\n")
+
+                    parts.append("\n### Top Long-Tail Keywords\n")
+                    for rec in st.session_state.long_tail[:15]:
+                        parts.append(f"- **{rec.text}** (Difficulty: {rec.difficulty:.0f})\n")
+
+                    parts.append(f"""
+## Content Strategy
+### Recommended Title
+{st.session_state.structure['titles'][0]}
+
+### Meta Description
+{st.session_state.structure['meta_description']}
+
+### Content Structure
+""")
+                    for heading in st.session_state.structure['headings']:
+                        parts.append(f"- {heading}\n")
+
+                    parts.append(f"""
+## SEO Guidelines
+- Target Length: {st.session_state.structure['target_length']:,} words
+- Keyword Density: {st.session_state.structure['keyword_density']}%
+- Focus on easy-difficulty keywords first
+- Use long-tail keywords in subheadings
+
+---
+*Generated by RankBuddy Real-Time SEO Analyzer*
+""")
+                    content = "".join(parts)
+                
+                elif export_format == "JSON":
+                    content = orjson.dumps({
+                        'keyword': seed_keyword,
+                        'timestamp': timestamp,
+                        'short_tail_keywords': [rec.text for rec in st.session_state.short_tail],
+                        'long_tail_keywords': [rec.text for rec in st.session_state.long_tail],
+                        'difficulties': st.session_state.difficulties,
+                        'content_structure': st.session_state.structure
+                    }, option=orjson.OPT_INDENT_2).decode()
+                
+                else:  # Text format
+                    content = f"""REAL-TIME SEO RESEARCH: {seed_keyword.upper()}
+Generated: {timestamp}
+
+KEYWORDS FOUND:
+Total: {len(st.session_state.all_keywords)}
+Short-tail: {len(st.session_state.short_tail)}
+Long-tail: {len(st.session_state.long_tail)}
+
+TOP KEYWORDS:
+"""
+                    parts = [content]
+                    for rec in st.session_state.all_keywords[:20]:
+                        parts.append(f"- {rec.text} (Difficulty: {rec.difficulty:.0f})\n")
+                    content = "".join(parts)
+                
+                st.download_button(
+                    label=f"Download {export_format}",
+                    data=content,
+                    file_name=f"rankbuddy_realtime_{seed_keyword.replace(' ', '_')}.{export_format.lower()}",
+                    mime="text/plain"
+                )
+                
+                st.code(content, language=export_format.lower())
+
+    else:
+        st.info("👆 Enter a keyword in the sidebar to start real-time analysis")
+        
+        # Show API status
+        st.subheader("🌐 API Status")
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.success("✅ Google Autocomplete")
+            st.caption("Real search suggestions")
+        
+        with col2:
+            st.success("✅ Datamuse API") 
+            st.caption("Semantic relationships")
+        
+        with col3:
+            st.success("✅ Wikipedia API")
+            st.caption("Related concepts")
+
+if __name__ == "__main__":
+    main()